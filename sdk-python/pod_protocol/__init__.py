@@ -12,13 +12,14 @@ __version__ = "1.5.0"
 __author__ = "PoD Protocol Team"
 __email__ = "dev@pod-protocol.com"
 
-from .client import PodComClient
+from .client import PodComClient, PodProtocolClient
 from .types import (
     PROGRAM_ID,
     MessageType,
     MessageStatus,
     ChannelVisibility,
     AGENT_CAPABILITIES,
+    AgentCapabilities,
     PodComError,
     AgentAccount,
     MessageAccount,
@@ -66,6 +67,7 @@ from .exceptions import (
 __all__ = [
     # Core
     "PodComClient",
+    "PodProtocolClient",
     "__version__",
     "__author__",
     "__email__",
@@ -76,6 +78,7 @@ __all__ = [
     "MessageStatus", 
     "ChannelVisibility",
     "AGENT_CAPABILITIES",
+    "AgentCapabilities",
     "PodComError",
     "AgentAccount",
     "MessageAccount",
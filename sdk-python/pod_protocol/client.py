@@ -4,6 +4,7 @@ Main PoD Protocol SDK client for Python applications
 
 import asyncio
 from typing import Optional, Union
+from solana.rpc.api import Client
 from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
@@ -25,6 +26,68 @@ from .utils import SecureMemoryManager
 from .exceptions import PodProtocolError, ConfigurationError
 
 
+class PodProtocolClient:
+    """
+    Convenience client exposing one instance of every protocol service.
+
+    Unlike PodComClient, this client takes the RPC URL and program ID
+    directly and does not require an Anchor program to be loaded, which
+    makes it suitable for instruction building, local validation and
+    analytics without a deployed program.
+
+    Example:
+        ```python
+        client = PodProtocolClient(
+            "https://api.devnet.solana.com",
+            PROGRAM_ID,
+            commitment="confirmed"
+        )
+        pda = client.agent.get_agent_pda(wallet.pubkey())
+        ```
+    """
+
+    def __init__(self, rpc_url: str, program_id: Union[str, Pubkey], commitment: str = "confirmed"):
+        """
+        Initialize the client
+
+        Args:
+            rpc_url: Solana RPC endpoint URL
+            program_id: PoD Protocol program ID (base58 string or Pubkey)
+            commitment: Commitment level for RPC requests
+
+        Raises:
+            ValueError: If program_id is not a valid public key
+            TypeError: If program_id has an unsupported type
+        """
+        if isinstance(program_id, str):
+            program_id = Pubkey.from_string(program_id)
+        elif not isinstance(program_id, Pubkey):
+            raise TypeError(f"program_id must be a Pubkey or base58 string, got {type(program_id).__name__}")
+
+        self.rpc_url = rpc_url
+        self.program_id = program_id
+        self.commitment = commitment
+        self.connection = Client(rpc_url, commitment=commitment)
+
+        service_kwargs = {
+            'connection': self.connection,
+            'program_id': self.program_id,
+            'commitment': self.commitment,
+        }
+
+        self.agent = AgentService(**service_kwargs)
+        self.message = MessageService(**service_kwargs)
+        self.channel = ChannelService(**service_kwargs)
+        self.escrow = EscrowService(**service_kwargs)
+        self.analytics = AnalyticsService(**service_kwargs)
+        self.discovery = DiscoveryService(**service_kwargs, analytics_service=self.analytics)
+        self.ipfs = IPFSService(**service_kwargs)
+        self.zk_compression = ZKCompressionService(
+            **service_kwargs,
+            ipfs_service=self.ipfs
+        )
+
+
 class PodComClient:
     """
     Main PoD Protocol SDK client for Python applications
@@ -106,8 +169,8 @@ class PodComClient:
         self.ipfs = IPFSService(service_config, self.config.ipfs)
         self.zk_compression = ZKCompressionService(
             service_config,
-            self.config.zk_compression,
-            self.ipfs
+            options=self.config.zk_compression,
+            ipfs_service=self.ipfs
         )
     
     async def initialize(self, wallet: Optional[Union[Keypair, Wallet]] = None) -> None:
@@ -2,18 +2,225 @@
 Agent service for PoD Protocol Python SDK
 """
 
+import base64
+import json
+import time
 from typing import Optional, List, Dict, Any, Union
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
+from solders.instruction import Instruction, AccountMeta
 from anchorpy import Program, Context
 from .base import BaseService
-from ..types import AgentAccount, CreateAgentOptions, UpdateAgentOptions, AGENT_CAPABILITIES
+from ..types import AgentAccount, AgentCapabilities, CreateAgentOptions, UpdateAgentOptions, AGENT_CAPABILITIES
+from ..utils import find_agent_pda
 from ..exceptions import AgentNotFoundError, PodProtocolError
 
+# Capability bit -> human readable name
+CAPABILITY_FLAG_NAMES = {
+    AgentCapabilities.TEXT: "text",
+    AgentCapabilities.IMAGE: "image",
+    AgentCapabilities.CODE: "code",
+    AgentCapabilities.ANALYSIS: "analysis",
+    AgentCapabilities.COMMUNICATION: "communication",
+    AgentCapabilities.LEARNING: "learning",
+}
+
+
 class AgentService(BaseService):
     """
     Service for managing AI agents in the PoD Protocol
     """
+
+    def find_agent_pda(self, agent_pubkey: Pubkey):
+        """
+        Derive the agent PDA and bump for a wallet public key
+        Args:
+            agent_pubkey: Agent wallet public key
+        Returns:
+            Tuple of (PDA, bump)
+        """
+        return find_agent_pda(agent_pubkey, self.program_id)
+
+    def get_agent_pda(self, agent_pubkey: Pubkey) -> Pubkey:
+        """
+        Get the agent PDA address for a wallet public key
+        Args:
+            agent_pubkey: Agent wallet public key
+        Returns:
+            Agent PDA address
+        """
+        pda, _ = self.find_agent_pda(agent_pubkey)
+        return pda
+
+    def generate_metadata_uri(self, metadata: Dict[str, Any]) -> str:
+        """
+        Encode agent metadata as a base64 data URI
+        Args:
+            metadata: Metadata dictionary
+        Returns:
+            data: URI containing the JSON-encoded metadata
+        """
+        json_string = json.dumps(metadata, sort_keys=True)
+        encoded = base64.b64encode(json_string.encode('utf-8')).decode('ascii')
+        return f"data:application/json;base64,{encoded}"
+
+    def create_register_instruction(
+        self,
+        agent_pubkey: Pubkey,
+        capabilities: int,
+        metadata_uri: str
+    ) -> Instruction:
+        """
+        Build a register_agent instruction
+        Args:
+            agent_pubkey: Agent wallet public key
+            capabilities: Capabilities bitmask
+            metadata_uri: Metadata URI
+        Returns:
+            Register instruction
+        """
+        self.validate_capabilities(capabilities)
+        agent_pda = self.get_agent_pda(agent_pubkey)
+        data = bytes([0]) + capabilities.to_bytes(8, 'little') + metadata_uri.encode('utf-8')
+        return Instruction(
+            program_id=self.program_id,
+            accounts=[
+                AccountMeta(pubkey=agent_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=agent_pubkey, is_signer=True, is_writable=True),
+            ],
+            data=data,
+        )
+
+    def create_update_instruction(
+        self,
+        agent_pubkey: Pubkey,
+        capabilities: int,
+        metadata_uri: str
+    ) -> Instruction:
+        """
+        Build an update_agent instruction
+        Args:
+            agent_pubkey: Agent wallet public key
+            capabilities: New capabilities bitmask
+            metadata_uri: New metadata URI
+        Returns:
+            Update instruction
+        """
+        self.validate_capabilities(capabilities)
+        agent_pda = self.get_agent_pda(agent_pubkey)
+        data = bytes([1]) + capabilities.to_bytes(8, 'little') + metadata_uri.encode('utf-8')
+        return Instruction(
+            program_id=self.program_id,
+            accounts=[
+                AccountMeta(pubkey=agent_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=agent_pubkey, is_signer=True, is_writable=False),
+            ],
+            data=data,
+        )
+
+    def validate_agent_data(self, agent_data: Dict[str, Any]) -> None:
+        """
+        Validate agent account data
+        Args:
+            agent_data: Agent data dictionary
+        Raises:
+            ValueError: If any field is invalid
+        """
+        if agent_data.get("pubkey") is None:
+            raise ValueError("Agent data must include a pubkey")
+        if "capabilities" in agent_data:
+            self.validate_capabilities(agent_data["capabilities"])
+        if "metadata_uri" in agent_data:
+            metadata_uri = agent_data["metadata_uri"]
+            if not isinstance(metadata_uri, str) or not metadata_uri:
+                raise ValueError("metadata_uri must be a non-empty string")
+        if "message_count" in agent_data and agent_data["message_count"] < 0:
+            raise ValueError("message_count cannot be negative")
+        if "reputation" in agent_data and agent_data["reputation"] < 0:
+            raise ValueError("reputation cannot be negative")
+
+    def validate_capabilities(self, capabilities: int) -> None:
+        """
+        Validate a capabilities bitmask
+        Args:
+            capabilities: Capabilities bitmask
+        Raises:
+            ValueError: If the bitmask is out of range
+        """
+        if not isinstance(capabilities, int):
+            raise ValueError("capabilities must be an integer bitmask")
+        if capabilities < 0 or capabilities > AgentCapabilities.ALL:
+            raise ValueError(f"capabilities must be between 0 and {AgentCapabilities.ALL}")
+
+    def calculate_reputation(self, metrics: Dict[str, Any]) -> int:
+        """
+        Calculate an agent reputation score from activity metrics
+        Args:
+            metrics: Activity metrics (successful_messages, total_messages, average_response_time)
+        Returns:
+            Reputation score between 0 and 1000
+        """
+        total = metrics.get("total_messages", 0)
+        if total <= 0:
+            return 0
+        successful = metrics.get("successful_messages", 0)
+        success_rate = successful / total
+        response_time = metrics.get("average_response_time", 0)
+        # Responsiveness decays towards 0 as average response time grows
+        responsiveness = 1000 / (1000 + max(0, response_time))
+        score = success_rate * 800 + responsiveness * 200
+        return round(min(1000, max(0, score)))
+
+    def get_capabilities_array(self, capabilities: int) -> List[str]:
+        """
+        Convert a capabilities bitmask to a list of capability names
+        Args:
+            capabilities: Capabilities bitmask
+        Returns:
+            List of capability names
+        """
+        names = []
+        for flag, name in CAPABILITY_FLAG_NAMES.items():
+            if capabilities & flag:
+                names.append(name)
+        return names
+
+    def capabilities_from_array(self, capabilities_array: List[str]) -> int:
+        """
+        Convert a list of capability names to a bitmask
+        Args:
+            capabilities_array: List of capability names
+        Returns:
+            Capabilities bitmask
+        """
+        capabilities = 0
+        for flag, name in CAPABILITY_FLAG_NAMES.items():
+            if name in capabilities_array:
+                capabilities |= flag
+        return capabilities
+
+    def format_agent_info(self, agent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format agent account data for display
+        Args:
+            agent_data: Raw agent data dictionary
+        Returns:
+            Formatted agent info
+        """
+        formatted = {
+            "pubkey": str(agent_data["pubkey"]),
+            "capabilities": self.get_capabilities_array(agent_data.get("capabilities", 0)),
+            "metadata_uri": agent_data.get("metadata_uri", ""),
+            "message_count": agent_data.get("message_count", 0),
+            "reputation": agent_data.get("reputation", 0),
+            "is_active": agent_data.get("is_active", False),
+        }
+        if "created_at" in agent_data:
+            formatted["created_at"] = agent_data["created_at"]
+        if "updated_at" in agent_data:
+            formatted["updated_at"] = agent_data["updated_at"]
+        return formatted
+
     async def register(self, options: CreateAgentOptions, wallet: Keypair) -> str:
         """
         Register a new agent
@@ -4,6 +4,7 @@ Analytics service for generating insights on agent activities, message patterns,
 
 import time
 import json
+from collections import Counter
 from typing import List, Optional, Dict, Any, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
@@ -73,6 +74,12 @@ class DashboardData:
     generated_at: int
 
 
+# Sentiment lexicons for trend analysis; frozen at import so analyze_trends
+# does no per-call set construction
+_POSITIVE_WORDS = frozenset({"fascinating", "advancement", "great", "good", "excellent"})
+_NEGATIVE_WORDS = frozenset({"bad", "poor", "failure", "broken", "slow"})
+
+
 class AnalyticsService(BaseService):
     """Service for analytics and insights."""
 
@@ -373,6 +380,320 @@ class AnalyticsService(BaseService):
         
         return report
 
+    async def get_network_stats(self) -> Dict[str, Any]:
+        """
+        Get summary statistics for the network.
+
+        Returns:
+            Network-wide counts and health score
+        """
+        agents = await self._fetch_agent_accounts()
+        messages = await self._fetch_message_accounts()
+        channels = await self._fetch_channel_accounts()
+
+        twenty_four_hours_ago = int(time.time()) - (24 * 60 * 60)
+        active_agents = sum(1 for agent in agents if agent.last_updated > twenty_four_hours_ago)
+
+        health = self.calculate_network_health({
+            "total_agents": len(agents),
+            "active_agents": active_agents,
+            "total_messages": len(messages),
+            "successful_messages": sum(
+                1 for msg in messages if msg.status != MessageStatus.FAILED
+            ),
+            "total_channels": len(channels),
+            "active_channels": sum(1 for channel in channels if channel.is_active)
+        })
+
+        return {
+            "total_agents": len(agents),
+            "active_agents": active_agents,
+            "total_messages": len(messages),
+            "total_channels": len(channels),
+            "network_health": health["overall_score"]
+        }
+
+    def calculate_network_health(self, network_data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Calculate network health metrics from aggregate counts.
+
+        Args:
+            network_data: Aggregate network counts
+
+        Returns:
+            Health rates and an overall score between 0 and 100
+        """
+        total_agents = network_data.get("total_agents", 0)
+        total_messages = network_data.get("total_messages", 0)
+        total_channels = network_data.get("total_channels", 0)
+
+        agent_activity_rate = (
+            network_data.get("active_agents", 0) / total_agents if total_agents else 0.0
+        )
+        message_success_rate = (
+            network_data.get("successful_messages", 0) / total_messages if total_messages else 0.0
+        )
+        channel_utilization_rate = (
+            network_data.get("active_channels", 0) / total_channels if total_channels else 0.0
+        )
+
+        overall_score = (
+            agent_activity_rate * 40 +
+            message_success_rate * 40 +
+            channel_utilization_rate * 20
+        )
+
+        return {
+            "agent_activity_rate": agent_activity_rate,
+            "message_success_rate": message_success_rate,
+            "channel_utilization_rate": channel_utilization_rate,
+            "overall_score": min(100.0, max(0.0, overall_score))
+        }
+
+    def calculate_agent_performance(self, agent_metrics: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Calculate performance scores for a single agent.
+
+        Args:
+            agent_metrics: Agent activity metrics
+
+        Returns:
+            Performance scores out of 100
+        """
+        messages_sent = agent_metrics.get("messages_sent", 0)
+        messages_received = agent_metrics.get("messages_received", 0)
+        successful = agent_metrics.get("successful_transactions", 0)
+        failed = agent_metrics.get("failed_transactions", 0)
+        response_time = agent_metrics.get("average_response_time", 0)
+
+        # Activity saturates at 500 combined messages
+        activity_score = min(100.0, (messages_sent + messages_received) / 5.0)
+
+        total_transactions = successful + failed
+        reliability_score = (
+            successful / total_transactions * 100 if total_transactions else 0.0
+        )
+
+        # Responsiveness decays towards 0 as response time grows past 10s
+        responsiveness_score = max(0.0, 100.0 - (response_time / 100.0))
+
+        overall_rating = (
+            activity_score * 0.3 +
+            reliability_score * 0.5 +
+            responsiveness_score * 0.2
+        )
+
+        return {
+            "activity_score": activity_score,
+            "reliability_score": reliability_score,
+            "responsiveness_score": responsiveness_score,
+            "overall_rating": overall_rating
+        }
+
+    async def get_usage_stats(self, time_range: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get usage statistics for a time range.
+
+        Args:
+            time_range: Dictionary with 'start' and 'end' datetimes
+
+        Returns:
+            Usage statistics for the period
+        """
+        messages = await self._fetch_message_accounts()
+
+        daily_counts = {}
+        senders = set()
+        for msg in messages:
+            from datetime import datetime
+            day = datetime.fromtimestamp(msg.created_at).strftime("%Y-%m-%d")
+            if day not in daily_counts:
+                daily_counts[day] = {"messages": 0, "users": set()}
+            daily_counts[day]["messages"] += 1
+            daily_counts[day]["users"].add(str(msg.sender))
+            senders.add(str(msg.sender))
+
+        daily_breakdown = [
+            {"date": day, "messages": data["messages"], "users": len(data["users"])}
+            for day, data in sorted(daily_counts.items())
+        ]
+
+        return {
+            "period": time_range,
+            "message_volume": len(messages),
+            "active_users": len(senders),
+            "transaction_count": len(messages),
+            "daily_breakdown": daily_breakdown
+        }
+
+    def analyze_trends(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze keyword trends across message contents.
+
+        Args:
+            messages: List of message dictionaries with 'content'
+
+        Returns:
+            List of trends with keyword, frequency and sentiment
+        """
+        counts = Counter()
+        for message in messages:
+            content = message.get("content", "")
+            counts.update(
+                word
+                for word in (raw.strip(".,!?") for raw in content.lower().split())
+                if len(word) >= 3
+            )
+
+        # Sentiment is a pure function of the keyword, so classify each
+        # unique keyword once here instead of on every occurrence above
+        positive = _POSITIVE_WORDS
+        negative = _NEGATIVE_WORDS
+        return [
+            {
+                "keyword": keyword,
+                "frequency": frequency,
+                "sentiment": (
+                    "positive" if keyword in positive
+                    else "negative" if keyword in negative
+                    else "neutral"
+                )
+            }
+            for keyword, frequency in counts.most_common()
+        ]
+
+    def generate_network_insights(self, network_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate actionable insights from network activity data.
+
+        Args:
+            network_data: Network distribution and activity data
+
+        Returns:
+            Insights with recommendations, opportunities and market gaps
+        """
+        recommendations = []
+        opportunities = []
+        market_gaps = []
+
+        agent_distribution = network_data.get("agent_distribution", {})
+        if agent_distribution:
+            total = sum(agent_distribution.values())
+            for capability, count in agent_distribution.items():
+                share = count / total if total else 0
+                if share < 0.2:
+                    market_gaps.append(f"Low supply of '{capability}' agents ({count})")
+                    opportunities.append(f"Register agents with '{capability}' capability")
+                elif share > 0.5:
+                    recommendations.append(f"'{capability}' capability is saturated; diversify")
+
+        channel_activity = network_data.get("channel_activity", {})
+        if channel_activity.get("private", 0) < channel_activity.get("public", 0) / 2:
+            opportunities.append("Private channels are underutilized")
+
+        message_patterns = network_data.get("message_patterns", {})
+        if message_patterns.get("volume") == "high":
+            recommendations.append("Enable message batching to reduce costs during peak volume")
+
+        return {
+            "recommendations": recommendations,
+            "opportunities": opportunities,
+            "market_gaps": market_gaps
+        }
+
+    def calculate_discovery_effectiveness(self, discovery_metrics: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Calculate how effective agent discovery has been.
+
+        Args:
+            discovery_metrics: Discovery activity metrics
+
+        Returns:
+            Effectiveness scores between 0 and 1
+        """
+        searches = discovery_metrics.get("searches_performed", 0)
+        connections = discovery_metrics.get("successful_connections", 0)
+
+        conversion_rate = connections / searches if searches else 0.0
+        recommendation_quality = discovery_metrics.get("average_recommendation_score", 0.0)
+        user_satisfaction = discovery_metrics.get("user_satisfaction_rate", 0.0)
+
+        overall_effectiveness = (
+            conversion_rate * 0.4 +
+            recommendation_quality * 0.3 +
+            user_satisfaction * 0.3
+        )
+
+        return {
+            "conversion_rate": conversion_rate,
+            "recommendation_quality": recommendation_quality,
+            "user_satisfaction": user_satisfaction,
+            "overall_effectiveness": overall_effectiveness
+        }
+
+    async def get_real_time_metrics(self) -> Dict[str, Any]:
+        """
+        Get real-time network metrics.
+
+        Returns:
+            Current network activity snapshot
+        """
+        agents = await self._fetch_agent_accounts()
+        messages = await self._fetch_recent_messages(
+            int(time.time() * 1000) - (60 * 60 * 1000)
+        )
+
+        capability_counts = {}
+        for agent in agents:
+            for cap in get_capability_names(agent.capabilities):
+                capability_counts[cap] = capability_counts.get(cap, 0) + 1
+        trending_capabilities = [
+            cap for cap, _ in sorted(capability_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        ]
+
+        # Load relative to an arbitrary 1000 messages/hour capacity
+        current_load = min(1.0, len(messages) / 1000.0)
+
+        return {
+            "active_agents": len(agents),
+            "current_load": current_load,
+            "trending_capabilities": trending_capabilities,
+            "network_congestion": current_load * 0.5
+        }
+
+    def generate_performance_report(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate a performance report from system metrics.
+
+        Args:
+            metrics: Measured latency and accuracy metrics
+
+        Returns:
+            Performance report with per-area ratings
+        """
+        def rate(score: float) -> str:
+            if score >= 0.9:
+                return "excellent"
+            if score >= 0.7:
+                return "good"
+            return "needs_improvement"
+
+        # Latency scores decay towards 0 at 1000ms
+        search_score = max(0.0, 1.0 - metrics.get("search_latency", 0) / 1000.0)
+        recommendation_score = metrics.get("recommendation_accuracy", 0.0)
+        system_score = (
+            metrics.get("cache_hit_rate", 0.0) * 0.5 +
+            max(0.0, 1.0 - metrics.get("api_response_time", 0) / 1000.0) * 0.5
+        )
+        overall_score = (search_score + recommendation_score + system_score) / 3
+
+        return {
+            "search_performance": rate(search_score),
+            "recommendation_performance": rate(recommendation_score),
+            "system_performance": rate(system_score),
+            "overall_health": rate(overall_score)
+        }
+
     # Helper Methods
     async def _fetch_agent_accounts(self, limit: int = 100) -> List[AgentAccount]:
         """Fetch agent accounts from the program."""
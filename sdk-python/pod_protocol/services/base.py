@@ -4,12 +4,30 @@ Base service class for PoD Protocol Python SDK services
 
 from typing import Optional
 from anchorpy import Program
+from solana.rpc.api import Client
 
 class BaseService:
-    def __init__(self, config: dict):
-        self.connection = config.get('connection')
-        self.program_id = config.get('program_id')
-        self.commitment = config.get('commitment')
+    """
+    Common state shared by all protocol services.
+
+    Services can be constructed either from a config dictionary (as the
+    high-level clients do) or with explicit keyword arguments:
+
+        AgentService({'connection': conn, 'program_id': pid, 'commitment': 'confirmed'})
+        AgentService(connection=conn, program_id=pid, commitment='confirmed')
+    """
+
+    def __init__(self, config=None, *, connection=None, program_id=None, commitment=None):
+        if isinstance(config, dict):
+            connection = config.get('connection', connection)
+            program_id = config.get('program_id', program_id)
+            commitment = config.get('commitment', commitment)
+        elif config is not None:
+            # Positional connection argument
+            connection = config
+        self.connection = connection
+        self.program_id = program_id
+        self.commitment = commitment or 'confirmed'
         self.program: Optional[Program] = None
 
     def set_program(self, program: Program):
@@ -18,5 +36,10 @@ class BaseService:
     def is_initialized(self) -> bool:
         return self.program is not None
 
+    def ensure_initialized(self) -> Program:
+        if self.program is None:
+            raise RuntimeError("Service not initialized. Call client.initialize() first.")
+        return self.program
+
     async def cleanup(self):
         pass
@@ -4,13 +4,12 @@ Provides functionality for creating, joining, and managing channels and their pa
 """
 
 import asyncio
+import time
 from typing import List, Optional, Dict, Any, Union
 from dataclasses import dataclass
 from enum import Enum
-from solana.publickey import PublicKey
-from solana.keypair import Keypair
-from solana.system_program import CreateAccountParams, create_account
-from solana.transaction import Transaction
+from solders.pubkey import Pubkey as PublicKey
+from solders.keypair import Keypair
 from solana.rpc.types import TxOpts
 from anchorpy import Provider, Program
 
@@ -129,11 +128,98 @@ class ChannelService(BaseService):
             "channel_account": channel_pda,
             "participant_account": participant_pda,
             "creator": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts=TxOpts(commitment=self.commitment))
         
         return tx
 
+    async def create(self, channel_data: Dict[str, Any], wallet: Keypair) -> Dict[str, Any]:
+        """
+        Create a new channel from a data dictionary.
+
+        Args:
+            channel_data: Channel fields (name, description, visibility, max_participants)
+            wallet: The wallet keypair for signing
+
+        Returns:
+            Created channel summary
+        """
+        options = CreateChannelOptions(
+            name=channel_data["name"],
+            description=channel_data.get("description", ""),
+            visibility=ChannelVisibility(channel_data.get("visibility", "public")),
+            max_participants=channel_data.get("max_participants", 100),
+            fee_per_message=channel_data.get("fee_per_message", 0)
+        )
+        signature = await self.create_channel(wallet, options)
+        channel_pda, _ = find_channel_pda(wallet.pubkey(), options.name, self.program_id)
+        return {
+            "id": str(channel_pda),
+            "signature": signature,
+            "name": options.name,
+            "owner": str(wallet.pubkey()),
+            "visibility": channel_data.get("visibility", "public"),
+            "participant_count": 1
+        }
+
+    async def join(self, channel_id: Union[str, PublicKey], wallet: Keypair) -> Dict[str, Any]:
+        """
+        Join a channel by its ID.
+
+        Args:
+            channel_id: Channel PDA (base58 string or Pubkey)
+            wallet: The wallet keypair for signing
+
+        Returns:
+            Join result summary
+        """
+        channel_pda = (
+            PublicKey.from_string(channel_id) if isinstance(channel_id, str) else channel_id
+        )
+        signature = await self.join_channel(wallet, channel_pda)
+        return {
+            "channel_id": str(channel_pda),
+            "signature": signature,
+            "participant": str(wallet.pubkey()),
+            "joined_at": int(time.time())
+        }
+
+    async def send_message(
+        self,
+        channel_id: Union[str, PublicKey],
+        content: str,
+        message_type: MessageType,
+        wallet: Keypair
+    ) -> Dict[str, Any]:
+        """
+        Send a message to a channel.
+
+        Args:
+            channel_id: Channel PDA (base58 string or Pubkey)
+            content: Message content
+            message_type: Message type
+            wallet: The wallet keypair for signing
+
+        Returns:
+            Sent message summary
+        """
+        channel_pda = (
+            PublicKey.from_string(channel_id) if isinstance(channel_id, str) else channel_id
+        )
+        options = BroadcastMessageOptions(
+            channel_pda=channel_pda,
+            content=content,
+            message_type=message_type
+        )
+        signature = await self.broadcast_message(wallet, options)
+        return {
+            "channel_id": str(channel_pda),
+            "signature": signature,
+            "sender": str(wallet.pubkey()),
+            "content": content,
+            "timestamp": int(time.time())
+        }
+
     async def get_channel(self, channel_pda: PublicKey) -> Optional[ChannelAccount]:
         """
         Get channel data.
@@ -279,7 +365,7 @@ class ChannelService(BaseService):
             "agent_account": agent_pda,
             "invitation_account": invitation_pda if invitation_account else None,
             "user": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts=TxOpts(commitment=self.commitment))
         
         return tx
@@ -366,7 +452,7 @@ class ChannelService(BaseService):
             "agent_account": agent_pda,
             "message_account": message_pda,
             "user": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts=TxOpts(commitment=self.commitment))
         
         return tx
@@ -412,7 +498,7 @@ class ChannelService(BaseService):
             "agent_account": agent_pda,
             "invitation_account": invitation_pda,
             "inviter": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts=TxOpts(commitment=self.commitment))
         
         return tx
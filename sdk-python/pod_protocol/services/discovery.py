@@ -96,6 +96,247 @@ class Recommendation:
 class DiscoveryService(BaseService):
     """Service for search and discovery of protocol entities."""
 
+    def __init__(self, config=None, *, analytics_service=None, **kwargs):
+        """
+        Initialize the discovery service.
+
+        Args:
+            config: Service configuration (see BaseService)
+            analytics_service: Optional AnalyticsService used to enhance
+                recommendations with live network data
+        """
+        super().__init__(config, **kwargs)
+        self.analytics_service = analytics_service
+
+    async def find_similar_agents(
+        self,
+        reference_agent: PublicKey,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find agents similar to a reference agent.
+
+        Args:
+            reference_agent: Public key of the agent to compare against
+            options: Search options (limit)
+
+        Returns:
+            List of similar agents with similarity scores
+        """
+        options = options or {}
+        limit = options.get("limit", 10)
+
+        search_result = await self.search_agents(AgentSearchFilters(limit=100))
+        reference = None
+        candidates = []
+        for agent in search_result.items:
+            if agent.pubkey == reference_agent:
+                reference = agent
+            else:
+                candidates.append(agent)
+
+        similar = []
+        for agent in candidates:
+            if reference is not None:
+                shared = bin(agent.capabilities & reference.capabilities).count("1")
+                total = bin(agent.capabilities | reference.capabilities).count("1")
+                capability_similarity = shared / total if total else 0.0
+                reputation_similarity = 1.0 - min(
+                    abs(agent.reputation - reference.reputation) / 100.0, 1.0
+                )
+                similarity_score = capability_similarity * 0.7 + reputation_similarity * 0.3
+            else:
+                similarity_score = 0.0
+            similar.append({
+                "pubkey": str(agent.pubkey),
+                "capabilities": get_capability_names(agent.capabilities),
+                "reputation": agent.reputation,
+                "similarity_score": similarity_score
+            })
+
+        similar.sort(key=lambda x: x["similarity_score"], reverse=True)
+        return similar[:limit]
+
+    async def get_collaboration_recommendations(
+        self,
+        agent_id: PublicKey,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Recommend agents to collaborate with.
+
+        Args:
+            agent_id: Public key of the agent seeking collaborators
+            options: Recommendation options (max_recommendations)
+
+        Returns:
+            List of recommendations with compatibility scores and reasons
+        """
+        options = options or {}
+        max_recommendations = options.get("max_recommendations", 10)
+
+        search_result = await self.search_agents(AgentSearchFilters(limit=100))
+        recommendations = []
+        for agent in search_result.items:
+            if agent.pubkey == agent_id:
+                continue
+            reasons = []
+            score = min(agent.reputation / 100.0, 1.0) * 0.5
+            if agent.reputation > 50:
+                reasons.append("High reputation")
+            capability_count = len(get_capability_names(agent.capabilities))
+            score += min(capability_count / 4.0, 1.0) * 0.5
+            if capability_count >= 2:
+                reasons.append("Complementary capabilities")
+            recommendations.append({
+                "agent": {
+                    "pubkey": str(agent.pubkey),
+                    "capabilities": get_capability_names(agent.capabilities)
+                },
+                "compatibility_score": score,
+                "reasons": reasons
+            })
+
+        recommendations.sort(key=lambda x: x["compatibility_score"], reverse=True)
+        return recommendations[:max_recommendations]
+
+    async def discover_channels(
+        self,
+        criteria: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Discover channels matching discovery criteria.
+
+        Args:
+            criteria: Channel criteria (topic, min/max participants, visibility)
+
+        Returns:
+            List of matching channel summaries
+        """
+        criteria = criteria or {}
+        filters = ChannelSearchFilters(
+            min_participants=criteria.get("min_participants"),
+            max_participants=criteria.get("max_participants"),
+            name_contains=criteria.get("topic")
+        )
+        if criteria.get("visibility"):
+            filters.visibility = [ChannelVisibility(criteria["visibility"])]
+
+        search_result = await self.search_channels(filters)
+        return [
+            {
+                "id": str(channel.pubkey),
+                "name": channel.name,
+                "participant_count": channel.participant_count,
+                "visibility": channel.visibility.value,
+                "topic": channel.description
+            }
+            for channel in search_result.items
+        ]
+
+    def calculate_compatibility(
+        self,
+        agent1: Dict[str, Any],
+        agent2: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """
+        Calculate compatibility between two agents.
+
+        Args:
+            agent1: First agent profile
+            agent2: Second agent profile
+
+        Returns:
+            Compatibility scores between 0 and 1
+        """
+        caps1 = set(agent1.get("capabilities", []))
+        caps2 = set(agent2.get("capabilities", []))
+        union = caps1 | caps2
+        capability_overlap = len(caps1 & caps2) / len(union) if union else 0.0
+
+        reputation_match = 1.0 - min(
+            abs(agent1.get("reputation", 0) - agent2.get("reputation", 0)) / 100.0, 1.0
+        )
+
+        activity_levels = {"low": 0, "medium": 1, "high": 2}
+        level1 = activity_levels.get(agent1.get("activity_level", "medium"), 1)
+        level2 = activity_levels.get(agent2.get("activity_level", "medium"), 1)
+        activity_alignment = 1.0 - abs(level1 - level2) / 2.0
+
+        overall_score = (
+            capability_overlap * 0.4 +
+            reputation_match * 0.3 +
+            activity_alignment * 0.3
+        )
+
+        return {
+            "capability_overlap": capability_overlap,
+            "reputation_match": reputation_match,
+            "activity_alignment": activity_alignment,
+            "overall_score": min(1.0, max(0.0, overall_score))
+        }
+
+    async def get_analytics_enhanced_recommendations(
+        self,
+        agent_id: PublicKey,
+        analytics_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recommendations boosted by network analytics data.
+
+        Args:
+            agent_id: Public key of the agent seeking recommendations
+            analytics_data: Network analytics (popular capabilities, trends)
+
+        Returns:
+            Recommendations annotated with analytics scores
+        """
+        popular_capabilities = set(analytics_data.get("popular_capabilities", []))
+        recommendations = await self.get_collaboration_recommendations(agent_id)
+
+        enhanced = []
+        for rec in recommendations:
+            agent_capabilities = set(rec["agent"].get("capabilities", []))
+            matching = agent_capabilities & popular_capabilities
+            analytics_boost = len(matching) * 0.05
+            trend_alignment = (
+                len(matching) / len(popular_capabilities) if popular_capabilities else 0.0
+            )
+            enhanced.append({
+                "agent": rec["agent"],
+                "analytics_boost": analytics_boost,
+                "trend_alignment": trend_alignment,
+                "network_fit": min(1.0, rec["compatibility_score"] + analytics_boost)
+            })
+
+        enhanced.sort(key=lambda x: x["network_fit"], reverse=True)
+        return enhanced
+
+    def adjust_search_criteria_for_load(
+        self,
+        criteria: Dict[str, Any],
+        real_time_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Adjust search criteria based on current network load.
+
+        Args:
+            criteria: Original search criteria
+            real_time_data: Real-time network metrics with 'current_load'
+
+        Returns:
+            Adjusted criteria with load factor
+        """
+        load_factor = real_time_data.get("current_load", 0.0)
+        limit = criteria.get("limit", 50)
+        # Shrink result sets under heavy load to keep queries cheap
+        adjusted_limit = max(1, round(limit * (1.0 - load_factor * 0.5)))
+
+        adjusted = dict(criteria)
+        adjusted["adjusted_limit"] = adjusted_limit
+        adjusted["load_factor"] = load_factor
+        return adjusted
+
     async def search_agents(
         self, 
         filters: Optional[AgentSearchFilters] = None
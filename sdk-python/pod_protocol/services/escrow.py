@@ -7,7 +7,8 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
 from .base import BaseService
-from ..types import PublicKey, Keypair
+from solders.pubkey import Pubkey as PublicKey
+from solders.keypair import Keypair
 from ..utils import find_agent_pda, find_escrow_pda
 
 
@@ -72,7 +73,7 @@ class EscrowService(BaseService):
             "channel_account": options.channel,
             "depositor_agent": agent_pda,
             "depositor": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts={"commitment": self.commitment})
         
         return tx
@@ -109,11 +110,60 @@ class EscrowService(BaseService):
             "channel_account": options.channel,
             "depositor_agent": agent_pda,
             "depositor": wallet.public_key,
-            "system_program": PublicKey("11111111111111111111111111111112"),
+            "system_program": PublicKey.from_string("11111111111111111111111111111112"),
         }).signers([wallet]).rpc(opts={"commitment": self.commitment})
         
         return tx
 
+    async def create(self, escrow_data: Dict[str, Any], wallet: Keypair) -> Dict[str, Any]:
+        """
+        Create an escrow from a data dictionary.
+
+        Args:
+            escrow_data: Escrow fields (amount, recipient, condition, timeout)
+            wallet: The wallet keypair for signing
+
+        Returns:
+            Created escrow summary
+        """
+        options = DepositEscrowOptions(
+            channel=escrow_data["recipient"],
+            amount=escrow_data["amount"]
+        )
+        signature = await self.deposit_escrow(wallet, options)
+        escrow_pda, _ = find_escrow_pda(options.channel, wallet.pubkey(), self.program_id)
+        return {
+            "id": str(escrow_pda),
+            "signature": signature,
+            "amount": options.amount,
+            "recipient": str(escrow_data["recipient"]),
+            "status": "active",
+            "created_at": int(time.time())
+        }
+
+    async def release(self, escrow_id: str, wallet: Keypair) -> Dict[str, Any]:
+        """
+        Release the funds held by an escrow.
+
+        Args:
+            escrow_id: Escrow account address
+            wallet: The wallet keypair for signing
+
+        Returns:
+            Release result summary
+        """
+        escrow_pda = PublicKey.from_string(escrow_id) if isinstance(escrow_id, str) else escrow_id
+        program = self.ensure_initialized()
+        account = await program.account.escrow_account.fetch(escrow_pda)
+        options = WithdrawEscrowOptions(channel=account.channel, amount=account.balance or 0)
+        signature = await self.withdraw_escrow(wallet, options)
+        return {
+            "id": str(escrow_pda),
+            "signature": signature,
+            "status": "released",
+            "released_at": int(time.time())
+        }
+
     async def get_escrow(
         self, 
         channel: PublicKey, 
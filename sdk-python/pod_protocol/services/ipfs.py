@@ -3,13 +3,28 @@ IPFS service for handling off-chain storage of PoD Protocol data.
 Integrates with ZK compression for cost-effective data management.
 """
 
+import asyncio
+import re
 import time
 import json
+import zlib
 import hashlib
-from typing import List, Optional, Dict, Any, Union, NamedTuple
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple, Union, NamedTuple
 from dataclasses import dataclass
 
+import blake3
+import orjson
+from Crypto.Hash import keccak
+
 from .base import BaseService
+from ..utils import format_bytes
+
+
+def _bulk_sha256(payloads: List[bytes]) -> List[str]:
+    """Hash a list of byte payloads with SHA-256 in one tight loop."""
+    sha256 = hashlib.sha256
+    return [sha256(payload).hexdigest() for payload in payloads]
 
 
 @dataclass
@@ -73,15 +88,38 @@ class IPFSService(BaseService):
     In production, this would integrate with actual IPFS nodes or services.
     """
 
-    def __init__(self, base_config, ipfs_config: Optional[IPFSConfig] = None):
+    DEFAULT_GATEWAY = "https://ipfs.io/ipfs/"
+    MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+
+    # Tuple so the class constant is immutable and get_gateway_urls can
+    # hand it out without a defensive copy per call
+    GATEWAY_URLS = (
+        "https://ipfs.io/ipfs/",
+        "https://gateway.pinata.cloud/ipfs/",
+        "https://cloudflare-ipfs.com/ipfs/",
+        "https://dweb.link/ipfs/",
+    )
+
+    def __init__(
+        self,
+        config=None,
+        ipfs_config: Optional[IPFSConfig] = None,
+        *,
+        connection=None,
+        program_id=None,
+        commitment=None
+    ):
         """
         Initialize IPFS service.
-        
+
         Args:
-            base_config: Base service configuration
+            config: Base service configuration
             ipfs_config: IPFS-specific configuration
+            connection: Solana connection (keyword alternative to config)
+            program_id: Program ID (keyword alternative to config)
+            commitment: Commitment level (keyword alternative to config)
         """
-        super().__init__(base_config)
+        super().__init__(config, connection=connection, program_id=program_id, commitment=commitment)
         self.config = ipfs_config or IPFSConfig()
         self._storage = {}  # Mock storage for development/testing
 
@@ -152,13 +190,14 @@ class IPFSService(BaseService):
             if self.config.disabled:
                 raise Exception("IPFS functionality is disabled")
             
-            # Serialize data
-            json_string = json.dumps(data, sort_keys=True)
-            json_bytes = json_string.encode('utf-8')
+            # Serialize data; orjson emits UTF-8 bytes directly, skipping
+            # the intermediate str and separate encode
+            json_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
             
-            # Create hash (mock CID)
-            hash_obj = hashlib.sha256(json_bytes)
-            content_hash = hash_obj.hexdigest()
+            # Create hash (mock CID). BLAKE3 here is purely an internal
+            # storage key and never reproduced on-chain, unlike
+            # create_content_hash which must match the Rust program.
+            content_hash = blake3.blake3(json_bytes).hexdigest()
             
             # Store in mock storage
             self._storage[content_hash] = json_bytes
@@ -197,9 +236,8 @@ class IPFSService(BaseService):
             else:
                 file_bytes = data
             
-            # Create hash (mock CID)
-            hash_obj = hashlib.sha256(file_bytes)
-            content_hash = hash_obj.hexdigest()
+            # Create hash (mock CID); see store_json for why BLAKE3 is safe here
+            content_hash = blake3.blake3(file_bytes).hexdigest()
             
             # Store in mock storage
             self._storage[content_hash] = file_bytes
@@ -232,11 +270,7 @@ class IPFSService(BaseService):
             if hash not in self._storage:
                 raise Exception(f"Content not found: {hash}")
             
-            json_bytes = self._storage[hash]
-            json_string = json_bytes.decode('utf-8')
-            data = json.loads(json_string)
-            
-            return data
+            return orjson.loads(self._storage[hash])
         except Exception as e:
             raise Exception(f"Failed to retrieve data from IPFS: {e}")
 
@@ -452,38 +486,307 @@ class IPFSService(BaseService):
         
         return results
 
+    async def batch_store_json(self, items: List[Dict[str, Any]]) -> List[IPFSStorageResult]:
+        """
+        Store a homogeneous batch of JSON items in a single fused pass.
+
+        Unlike batch_store, which dispatches one store call per item, this
+        serializes every item with orjson in one comprehension, hashes all
+        payloads in one C-level loop off the event loop, and updates the
+        storage map in bulk.
+
+        Args:
+            items: List of JSON-serializable dictionaries
+
+        Returns:
+            List of IPFS storage results, in input order
+        """
+        if self.config.disabled:
+            raise Exception("IPFS functionality is disabled")
+
+        encoded = [orjson.dumps(item, option=orjson.OPT_SORT_KEYS) for item in items]
+        digests = await asyncio.to_thread(_bulk_sha256, encoded)
+        self._storage.update(zip(digests, encoded))
+
+        return [
+            IPFSStorageResult(
+                hash=digest,
+                cid=digest,
+                size=len(payload),
+                url=f"{self.config.gateway_url}/{digest}"
+            )
+            for digest, payload in zip(digests, encoded)
+        ]
+
     def get_gateway_url(self, hash: str, gateway: str = "https://ipfs.io/ipfs/") -> str:
         """
         Get gateway URL for content.
-        
+
         Args:
             hash: Content hash
             gateway: Gateway base URL
-            
+
         Returns:
             Full gateway URL
         """
         return f"{gateway}{hash}"
 
+    def generate_ipfs_url(self, hash: str, gateway: Optional[str] = None) -> str:
+        """
+        Generate a gateway URL for an IPFS hash.
+
+        Args:
+            hash: Content hash
+            gateway: Optional gateway base URL (defaults to DEFAULT_GATEWAY)
+
+        Returns:
+            Full gateway URL
+        """
+        return f"{gateway or self.DEFAULT_GATEWAY}{hash}"
+
+    def get_gateway_urls(self) -> Tuple[str, ...]:
+        """
+        Get the known public IPFS gateway URLs.
+
+        Returns:
+            Tuple of gateway base URLs
+        """
+        return self.GATEWAY_URLS
+
+    def prepare_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepare metadata for upload by normalizing image links and
+        stamping version information.
+
+        Args:
+            metadata: Raw metadata dictionary
+
+        Returns:
+            Prepared metadata ready for upload
+        """
+        self.validate_metadata(metadata)
+        prepared = dict(metadata)
+        image = prepared.get("image")
+        if image and not image.startswith("http"):
+            prepared["image"] = self.generate_ipfs_url(image)
+        prepared["version"] = "1.0.0"
+        prepared["created_at"] = int(time.time() * 1000)
+        return prepared
+
+    def validate_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Validate metadata before upload.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Raises:
+            ValueError: If the metadata is missing or malformed
+        """
+        if not metadata or not isinstance(metadata, dict):
+            raise ValueError("Metadata must be a non-empty dictionary")
+        name = metadata.get("name")
+        if not name or not isinstance(name, str):
+            raise ValueError("Metadata must include a non-empty name")
+        if "description" in metadata and not isinstance(metadata["description"], str):
+            raise ValueError("Metadata description must be a string")
+
+    def estimate_storage_cost(self, data_size: int) -> Dict[str, Any]:
+        """
+        Estimate the cost of storing data on IPFS.
+
+        Args:
+            data_size: Data size in bytes
+
+        Returns:
+            Cost estimate
+        """
+        # Rough pinning-service pricing: cost per GB-month prorated to bytes
+        cost_per_byte = 0.0000001
+        return {
+            "size": data_size,
+            "estimated_cost": data_size * cost_per_byte,
+            "currency": "USD",
+        }
+
+    def calculate_pin_cost(self, data_size: int, pin_duration: int) -> Dict[str, float]:
+        """
+        Calculate the cost of pinning content for a duration.
+
+        Args:
+            data_size: Data size in bytes
+            pin_duration: Pin duration in days
+
+        Returns:
+            Cost breakdown
+        """
+        base_cost = 0.01
+        size_cost = data_size * 0.0000001
+        duration_cost = pin_duration * 0.001
+        return {
+            "base_cost": base_cost,
+            "size_cost": size_cost,
+            "duration_cost": duration_cost,
+            "total_cost": base_cost + size_cost + duration_cost,
+        }
+
+    async def pin(self, hash: str) -> Dict[str, Any]:
+        """
+        Pin content by hash.
+
+        Args:
+            hash: Content hash to pin
+
+        Returns:
+            Pin result
+        """
+        await self.pin_content(hash)
+        return {"success": True, "hash": hash}
+
+    async def unpin(self, hash: str) -> Dict[str, Any]:
+        """
+        Unpin content by hash.
+
+        Args:
+            hash: Content hash to unpin
+
+        Returns:
+            Unpin result
+        """
+        await self.unpin_content(hash)
+        return {"success": True, "hash": hash}
+
+    async def upload(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Upload metadata to IPFS.
+
+        Args:
+            metadata: Metadata dictionary
+
+        Returns:
+            Upload result with hash, url and size
+        """
+        result = await self.store_json(metadata)
+        return {
+            "hash": result.hash,
+            "url": result.url,
+            "size": result.size,
+        }
+
+    async def retrieve(self, hash: str) -> Dict[str, Any]:
+        """
+        Retrieve metadata from IPFS.
+
+        Args:
+            hash: Content hash
+
+        Returns:
+            Retrieved metadata
+        """
+        return await self.retrieve_json(hash)
+
+    def compress_data(self, data: Union[str, bytes]) -> bytes:
+        """
+        Compress data with zlib.
+
+        Args:
+            data: Data to compress; bytes skip the UTF-8 encode entirely
+
+        Returns:
+            Compressed bytes
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return zlib.compress(data)
+
+    def decompress_data(self, compressed: bytes) -> str:
+        """
+        Decompress zlib-compressed data.
+
+        Args:
+            compressed: Compressed bytes
+
+        Returns:
+            Original string data
+        """
+        return zlib.decompress(compressed).decode('utf-8')
+
+    def calculate_integrity_hash(
+        self, data: Union[str, bytes], *, hex: bool = True
+    ) -> Union[str, bytes]:
+        """
+        Calculate a SHA-256 integrity hash for data.
+
+        Args:
+            data: Data to hash; bytes skip the UTF-8 encode entirely
+            hex: Return a hex digest (default); False returns the raw
+                32-byte digest, skipping hexlification for callers that
+                compare digests directly
+
+        Returns:
+            64-character hex digest, or 32 raw bytes when hex=False
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        digest = hashlib.sha256(data)
+        return digest.hexdigest() if hex else digest.digest()
+
+    def verify_content_integrity(self, content: str, expected_hash: str) -> bool:
+        """
+        Verify content against an expected integrity hash.
+
+        Args:
+            content: Content to verify
+            expected_hash: Expected SHA-256 hex digest
+
+        Returns:
+            True if the content matches the hash
+        """
+        return self.calculate_integrity_hash(content) == expected_hash
+
+    def format_metadata_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a raw upload response for display.
+
+        Args:
+            response: Raw response with hash, size and upload_time
+
+        Returns:
+            Formatted response
+        """
+        formatted = dict(response)
+        formatted["url"] = self.generate_ipfs_url(response["hash"])
+        formatted["formatted_size"] = format_bytes(response.get("size", 0))
+        upload_time = response.get("upload_time")
+        if upload_time is not None:
+            formatted["upload_date"] = datetime.utcfromtimestamp(upload_time).isoformat()
+        else:
+            formatted["upload_date"] = None
+        return formatted
+
+    # Compiled once at class creation; each alternative anchors the whole
+    # string so the match runs as a single C-level scan:
+    #  - internal mock CIDs are 64-char hex digests
+    #  - CIDv0 is a base58-encoded SHA-256 multihash, 46 chars starting "Qm"
+    #  - CIDv1 is lowercase base32 with the "b" multibase prefix
+    _CID_RE = re.compile(
+        r"(?:[0-9a-fA-F]{64}"
+        r"|Qm[1-9A-HJ-NP-Za-km-z]{44}"
+        r"|baf[a-z2-7]{43,})\Z"
+    )
+
     @staticmethod
     def is_valid_ipfs_hash(hash: str) -> bool:
         """
         Validate IPFS hash format.
-        
+
         Args:
             hash: Hash to validate
-            
+
         Returns:
             True if valid hash format
         """
-        try:
-            # Basic validation - check if it's a hex string of appropriate length
-            if len(hash) == 64 and all(c in '0123456789abcdef' for c in hash.lower()):
-                return True
-            # Could add more sophisticated CID validation here
-            return False
-        except:
-            return False
+        return isinstance(hash, str) and IPFSService._CID_RE.match(hash) is not None
 
     @staticmethod
     def create_content_hash(content: str) -> str:
@@ -498,17 +801,14 @@ class IPFSService(BaseService):
             Content hash
         """
         # Equivalent to `hash_to_bn254_field_size_be` in Rust
-        # 1. Hash the UTF-8 bytes with SHA256 and a bump seed (0xff)
-        content_bytes = content.encode('utf-8')
-        bump_seed = bytes([0xff])
-        combined = content_bytes + bump_seed
-        
-        hash_obj = hashlib.sha256(combined)
-        field_sized_hash = bytearray(hash_obj.digest())
-        
+        # 1. Hash the UTF-8 bytes with Keccak256 and a bump seed (0xff)
+        hasher = keccak.new(digest_bits=256)
+        hasher.update(content.encode('utf-8') + bytes([0xff]))
+        field_sized_hash = bytearray(hasher.digest())
+
         # 2. Zero the first byte so the result fits within the BN254 field
         field_sized_hash[0] = 0
-        
+
         return field_sized_hash.hex()
 
     @staticmethod
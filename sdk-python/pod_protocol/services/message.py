@@ -2,19 +2,361 @@
 Message service for PoD Protocol Python SDK
 """
 
+import hashlib
+import time
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
+from solders.instruction import Instruction, AccountMeta
 from anchorpy import Context
 from .base import BaseService
-from ..types import MessageAccount, SendMessageOptions, MessageType
+from ..types import MessageAccount, SendMessageOptions, MessageType, MessageStatus
 from ..utils import find_agent_pda, find_message_pda, hash_payload
 from ..exceptions import PodProtocolError
 
+# Maximum length of a message payload in characters
+MAX_CONTENT_LENGTH = 10000
+
+# Bound once; skips the hashlib module attribute lookup on every hash
+_sha256 = hashlib.sha256
+
+
+@lru_cache(maxsize=4096)
+def _pubkey_str(pubkey) -> str:
+    """Base58-encode a pubkey, memoized by the key object.
+
+    Base58 encoding dominates per-message formatting cost, and message
+    listings repeat the same handful of senders and recipients.
+    """
+    return str(pubkey)
+
+
+@lru_cache(maxsize=4096)
+def _hash_content_cached(content: str) -> bytes:
+    """Hash content with SHA-256, memoized by the content string.
+
+    PDA derivation and instruction building hash the same content
+    several times per message; the hash is pure, so repeats are free.
+    """
+    return _sha256(content.encode('utf-8')).digest()
+
+@lru_cache(maxsize=8192)
+def _find_message_pda_cached(
+    program_id: Pubkey,
+    sender: Pubkey,
+    recipient: Pubkey,
+    content_hash: bytes,
+    message_type: int
+) -> Pubkey:
+    """Derive a message PDA, memoized per argument tuple.
+
+    Derivation is pure but runs bump-seed SHA-256 iterations inside
+    find_program_address. The cache lives at module level, keyed only on
+    the seed inputs, so no service instance is kept alive by an entry.
+    """
+    seeds = [
+        b"message",
+        bytes(sender),
+        bytes(recipient),
+        content_hash,
+        bytes([message_type]),
+    ]
+    pda, _ = Pubkey.find_program_address(seeds, program_id)
+    return pda
+
+
+# Display names indexed by enum value; both enums are contiguous from 0,
+# so tuple indexing replaces a dict lookup on the formatting paths
+MESSAGE_TYPE_NAMES = ("text", "image", "code", "data", "command", "response", "custom")
+
+MESSAGE_STATUS_NAMES = ("pending", "delivered", "read", "failed")
+
+
 class MessageService(BaseService):
     """
     Service for managing messages in the PoD Protocol
     """
+
+    def hash_content(self, content: str) -> bytes:
+        """
+        Hash message content with SHA-256
+        Args:
+            content: Message content
+        Returns:
+            32-byte content hash
+        """
+        return _hash_content_cached(content)
+
+    def get_message_pda(
+        self,
+        sender: Pubkey,
+        recipient: Pubkey,
+        content: str,
+        message_type: MessageType
+    ) -> Pubkey:
+        """
+        Derive the message PDA for a sender/recipient/content tuple
+
+        Results are memoized by _find_message_pda_cached; caching the
+        method itself would pin self in every cache entry.
+        Args:
+            sender: Sender public key
+            recipient: Recipient public key
+            content: Message content
+            message_type: Message type
+        Returns:
+            Message PDA address
+        """
+        return _find_message_pda_cached(
+            self.program_id, sender, recipient,
+            self.hash_content(content), int(message_type)
+        )
+
+    def validate_message_type(self, message_type) -> None:
+        """
+        Validate a message type value
+        Args:
+            message_type: Message type to validate
+        Raises:
+            ValueError: If the message type is not valid
+        """
+        if isinstance(message_type, MessageType):
+            return
+        if isinstance(message_type, int) and 0 <= message_type < len(MESSAGE_TYPE_NAMES):
+            return
+        raise ValueError(f"Invalid message type: {message_type!r}")
+
+    def validate_content(self, content) -> None:
+        """
+        Validate message content
+        Args:
+            content: Message content
+        Raises:
+            ValueError: If the content is empty, missing or too long
+        """
+        if not isinstance(content, str) or not content:
+            raise ValueError("Message content must be a non-empty string")
+        if len(content) > MAX_CONTENT_LENGTH:
+            raise ValueError(f"Message content exceeds maximum length of {MAX_CONTENT_LENGTH}")
+
+    def create_send_instruction(
+        self,
+        sender: Pubkey,
+        recipient: Pubkey,
+        content: str,
+        message_type: MessageType
+    ) -> Instruction:
+        """
+        Build a send_message instruction
+        Args:
+            sender: Sender public key
+            recipient: Recipient public key
+            content: Message content
+            message_type: Message type
+        Returns:
+            Send message instruction
+        """
+        self.validate_content(content)
+        self.validate_message_type(message_type)
+        message_pda = self.get_message_pda(sender, recipient, content, message_type)
+        data = bytes([0, int(message_type)]) + self.hash_content(content)
+        return Instruction(
+            program_id=self.program_id,
+            accounts=[
+                AccountMeta(pubkey=message_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=sender, is_signer=True, is_writable=True),
+                AccountMeta(pubkey=recipient, is_signer=False, is_writable=False),
+            ],
+            data=data,
+        )
+
+    def create_update_status_instruction(
+        self,
+        sender: Pubkey,
+        recipient: Pubkey,
+        content: str,
+        message_type: MessageType,
+        status: MessageStatus
+    ) -> Instruction:
+        """
+        Build an update_message_status instruction
+        Args:
+            sender: Sender public key
+            recipient: Recipient public key
+            content: Message content
+            message_type: Message type
+            status: New message status
+        Returns:
+            Update status instruction
+        """
+        message_pda = self.get_message_pda(sender, recipient, content, message_type)
+        data = bytes([1, int(status)])
+        return Instruction(
+            program_id=self.program_id,
+            accounts=[
+                AccountMeta(pubkey=message_pda, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=recipient, is_signer=True, is_writable=False),
+            ],
+            data=data,
+        )
+
+    def calculate_expiry(self, ttl: int) -> int:
+        """
+        Calculate a message expiry timestamp
+        Args:
+            ttl: Time to live in seconds
+        Returns:
+            Unix timestamp when the message expires
+        """
+        return time.time_ns() // 1_000_000_000 + ttl
+
+    def is_expired(self, expires_at: int) -> bool:
+        """
+        Check whether a message has expired
+        Args:
+            expires_at: Expiry timestamp
+        Returns:
+            True if the message is expired
+        """
+        return expires_at < time.time_ns() // 1_000_000_000
+
+    def are_expired(self, timestamps: List[int]) -> List[bool]:
+        """
+        Check many expiry timestamps against one clock snapshot
+        Args:
+            timestamps: Expiry timestamps
+        Returns:
+            Expiry flags in input order
+        """
+        now = time.time_ns() // 1_000_000_000
+        return [expires_at < now for expires_at in timestamps]
+
+    def filter_unexpired(self, timestamps: List[int]) -> List[int]:
+        """
+        Keep only the timestamps that have not yet expired
+        Args:
+            timestamps: Expiry timestamps
+        Returns:
+            Unexpired timestamps in input order
+        """
+        now = time.time_ns() // 1_000_000_000
+        return [expires_at for expires_at in timestamps if expires_at >= now]
+
+    def get_message_type_string(self, message_type: MessageType) -> str:
+        """
+        Convert a message type to its display string
+        Args:
+            message_type: Message type
+        Returns:
+            Lowercase type name
+        """
+        return MESSAGE_TYPE_NAMES[message_type]
+
+    def get_status_string(self, status: MessageStatus) -> str:
+        """
+        Convert a message status to its display string
+        Args:
+            status: Message status
+        Returns:
+            Lowercase status name
+        """
+        return MESSAGE_STATUS_NAMES[status]
+
+    def format_message(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format message data for display
+        Args:
+            message_data: Raw message data dictionary
+        Returns:
+            Formatted message info
+        """
+        return {
+            "sender": _pubkey_str(message_data["sender"]),
+            "recipient": _pubkey_str(message_data["recipient"]),
+            "content": message_data["content"],
+            "type": self.get_message_type_string(message_data["message_type"]),
+            "status": self.get_status_string(message_data["status"]),
+            "timestamp": message_data.get("timestamp", 0),
+        }
+
+    def estimate_message_cost(self, content: str, message_type: MessageType) -> Dict[str, int]:
+        """
+        Estimate the cost of sending a message
+        Args:
+            content: Message content
+            message_type: Message type
+        Returns:
+            Cost breakdown in lamports
+        """
+        base_fee = 5000
+        content_fee = len(content.encode('utf-8')) * 10
+        return {
+            "base_fee": base_fee,
+            "content_fee": content_fee,
+            "total_fee": base_fee + content_fee,
+        }
+
+    async def update_status(
+        self,
+        sender: Pubkey,
+        recipient: Pubkey,
+        content: str,
+        message_type: MessageType,
+        status: MessageStatus,
+        wallet: Keypair
+    ) -> Dict[str, Any]:
+        """
+        Update the delivery status of a message
+        Args:
+            sender: Sender public key
+            recipient: Recipient public key
+            content: Message content
+            message_type: Message type
+            status: New message status
+            wallet: Wallet to sign the transaction
+        Returns:
+            Status update result
+        """
+        if not self.is_initialized():
+            raise PodProtocolError("Service not initialized. Call client.initialize() first.")
+        message_pda = self.get_message_pda(sender, recipient, content, message_type)
+        tx = await self.program.rpc["update_message_status"](
+            int(status),
+            ctx=Context(
+                accounts={
+                    "message_account": message_pda,
+                    "signer": wallet.pubkey(),
+                },
+                signers=[wallet],
+            ),
+        )
+        return {"signature": tx, "status": self.get_status_string(status)}
+
+    async def get_history(
+        self,
+        sender: Pubkey,
+        recipient: Pubkey,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the message history between two agents
+        Args:
+            sender: Sender public key
+            recipient: Recipient public key
+            limit: Maximum number of messages
+        Returns:
+            List of messages ordered by timestamp
+        """
+        messages = await self.get_for_agent(sender, direction='both', limit=limit)
+        history = [
+            msg for msg in messages
+            if (msg.sender == sender and msg.recipient == recipient)
+            or (msg.sender == recipient and msg.recipient == sender)
+        ]
+        history.sort(key=lambda m: m.timestamp)
+        return history[:limit]
+
     async def send(self, options: SendMessageOptions, wallet: Keypair) -> str:
         """
         Send a message to another agent
@@ -97,25 +439,27 @@ class MessageService(BaseService):
         accounts = await self.program.account["message_account"].all()
         messages = []
         for acc in accounts:
-            msg = MessageAccount(
-                pubkey=acc.public_key,
-                sender=acc.account.sender,
-                recipient=acc.account.recipient,
-                payload_hash=acc.account.payload_hash,
-                payload=acc.account.payload,
-                message_type=acc.account.message_type,
-                timestamp=acc.account.timestamp,
-                created_at=acc.account.timestamp,
-                expires_at=acc.account.expires_at,
-                status=acc.account.status,
-                bump=acc.account.bump,
-            )
-            if direction == 'sent' and msg.sender != agent_pubkey:
+            raw = acc.account
+            # Filter on the raw account first so skipped rows never pay
+            # for MessageAccount construction
+            if direction == 'sent' and raw.sender != agent_pubkey:
                 continue
-            if direction == 'received' and msg.recipient != agent_pubkey:
+            if direction == 'received' and raw.recipient != agent_pubkey:
                 continue
-            if status and msg.status != status:
+            if status and raw.status != status:
                 continue
-            messages.append(msg)
+            messages.append(MessageAccount(
+                pubkey=acc.public_key,
+                sender=raw.sender,
+                recipient=raw.recipient,
+                payload_hash=raw.payload_hash,
+                payload=raw.payload,
+                message_type=raw.message_type,
+                timestamp=raw.timestamp,
+                created_at=raw.timestamp,
+                expires_at=raw.expires_at,
+                status=raw.status,
+                bump=raw.bump,
+            ))
         messages.sort(key=lambda m: m.timestamp, reverse=True)
         return messages[:limit]
@@ -2,30 +2,36 @@
 PoD Protocol types and constants for Python SDK
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Optional, Union, Dict, Any, List
 from dataclasses import dataclass
 from solders.pubkey import Pubkey
+from solders.keypair import Keypair
+
+# Alias kept for services written against the legacy solana-py naming
+PublicKey = Pubkey
 
 # Program ID on Solana Devnet
 PROGRAM_ID = Pubkey.from_string("HEpGLgYsE1kP8aoYKyLFc3JVVrofS7T4zEA6fWBJsZps")
 
 
-class MessageType(str, Enum):
+class MessageType(IntEnum):
     """Message types supported by PoD Protocol"""
-    TEXT = "text"
-    DATA = "data"
-    COMMAND = "command"
-    RESPONSE = "response"
-    CUSTOM = "custom"
+    TEXT = 0
+    IMAGE = 1
+    CODE = 2
+    DATA = 3
+    COMMAND = 4
+    RESPONSE = 5
+    CUSTOM = 6
 
 
-class MessageStatus(str, Enum):
+class MessageStatus(IntEnum):
     """Message status in the delivery lifecycle"""
-    PENDING = "pending"
-    DELIVERED = "delivered"
-    READ = "read"
-    FAILED = "failed"
+    PENDING = 0
+    DELIVERED = 1
+    READ = 2
+    FAILED = 3
 
 
 class ChannelVisibility(str, Enum):
@@ -55,6 +61,18 @@ class AGENT_CAPABILITIES:
     CUSTOM_4 = 1 << 7          # 128
 
 
+class AgentCapabilities:
+    """Agent content capabilities as bitmask values"""
+    TEXT = 1 << 0           # 1
+    IMAGE = 1 << 1          # 2
+    CODE = 1 << 2           # 4
+    ANALYSIS = 1 << 3       # 8
+    COMMUNICATION = 1 << 4  # 16
+    LEARNING = 1 << 5       # 32
+
+    ALL = TEXT | IMAGE | CODE | ANALYSIS | COMMUNICATION | LEARNING
+
+
 @dataclass
 class AgentAccount:
     """Agent account data structure"""
@@ -351,9 +369,9 @@ class CompressedChannelParticipant:
     channel: Pubkey
     participant: Pubkey
     name: str
+    joined_at: int
     avatar_hash: Optional[str] = None
     metadata_hash: Optional[str] = None
-    joined_at: int
 
 
 @dataclass
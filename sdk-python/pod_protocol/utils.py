@@ -2,29 +2,62 @@
 PoD Protocol Python SDK - Utility functions for PDA derivation and cryptography
 """
 
+import weakref
+from functools import lru_cache
+
 from solders.pubkey import Pubkey
 import hashlib
 
+# Bound once so hot hashing loops skip the module attribute lookup
+_sha256 = hashlib.sha256
+
 # PDA utilities
 
+# Seed constants hoisted to module scope so tight PDA-derivation loops
+# never re-create them
+_AGENT_SEED = b"agent"
+_MESSAGE_SEED = b"message"
+_CHANNEL_SEED = b"channel"
+_ESCROW_SEED = b"escrow"
+
+@lru_cache(maxsize=1024)
+def _encode_name(name: str) -> bytes:
+    """Cache the UTF-8 encoding of channel names used as PDA seeds."""
+    return name.encode("utf-8")
+
+@lru_cache(maxsize=1024)
+def _pubkey_bytes(pubkey: Pubkey) -> bytes:
+    """Cache the 32-byte form of pubkeys; bytes(Pubkey) copies per call."""
+    return bytes(pubkey)
+
 def find_agent_pda(agent_pubkey: Pubkey, program_id: Pubkey):
-    seeds = [b"agent", bytes(agent_pubkey)]
+    seeds = [_AGENT_SEED, _pubkey_bytes(agent_pubkey)]
     return Pubkey.find_program_address(seeds, program_id)
 
 def find_message_pda(sender: Pubkey, recipient: Pubkey, payload_hash: bytes, program_id: Pubkey):
-    seeds = [b"message", bytes(sender), bytes(recipient), payload_hash]
+    seeds = [_MESSAGE_SEED, _pubkey_bytes(sender), _pubkey_bytes(recipient), payload_hash]
     return Pubkey.find_program_address(seeds, program_id)
 
 def find_channel_pda(creator: Pubkey, name: str, program_id: Pubkey):
-    seeds = [b"channel", bytes(creator), name.encode("utf-8")]
+    seeds = [_CHANNEL_SEED, _pubkey_bytes(creator), _encode_name(name)]
     return Pubkey.find_program_address(seeds, program_id)
 
 def find_escrow_pda(channel: Pubkey, depositor: Pubkey, program_id: Pubkey):
-    seeds = [b"escrow", bytes(channel), bytes(depositor)]
+    seeds = [_ESCROW_SEED, _pubkey_bytes(channel), _pubkey_bytes(depositor)]
     return Pubkey.find_program_address(seeds, program_id)
 
 def hash_payload(payload: str) -> bytes:
-    return hashlib.sha256(payload.encode("utf-8")).digest()
+    return _sha256(payload.encode("utf-8")).digest()
+
+def hash_payload_batch(payloads) -> list:
+    """Hash many payloads in one tight loop for bulk PDA derivation.
+
+    Binding the hash constructor to a local and doing the whole batch in a
+    single comprehension keeps per-payload Python overhead to one call and
+    lets the C-level SHA-256 run back to back.
+    """
+    sha256 = _sha256
+    return [sha256(payload.encode("utf-8")).digest() for payload in payloads]
 
 def verify_payload_hash(payload: str, hash_bytes: bytes) -> bool:
     return hash_payload(payload) == hash_bytes
@@ -42,22 +75,98 @@ def is_valid_public_key(pubkey: str) -> bool:
     except Exception:
         return False
 
+# Capability helpers
+
+CAPABILITY_NAMES = {
+    1: "TRADING",
+    2: "ANALYSIS",
+    4: "DATA_PROCESSING",
+    8: "CONTENT_GENERATION",
+    16: "CUSTOM_1",
+    32: "CUSTOM_2",
+    64: "CUSTOM_3",
+    128: "CUSTOM_4",
+}
+
+def has_capability(capabilities: int, capability: int) -> bool:
+    return (capabilities & capability) == capability
+
+def get_capability_names(capabilities: int):
+    return [name for bit, name in CAPABILITY_NAMES.items() if has_capability(capabilities, bit)]
+
+# Formatting helpers
+
+def format_public_key(pubkey, length: int = 8) -> str:
+    key = pubkey if isinstance(pubkey, str) else str(pubkey)
+    if len(key) <= length + 3:
+        return key
+    start = length // 2
+    end = length - start
+    return f"{key[:start]}...{key[-end:]}"
+
+def format_duration(ms: int) -> str:
+    seconds = int(ms // 1000)
+    minutes = seconds // 60
+    hours = minutes // 60
+    days = hours // 24
+    if days > 0:
+        return f"{days}d {hours % 24}h"
+    if hours > 0:
+        return f"{hours}h {minutes % 60}m"
+    if minutes > 0:
+        return f"{minutes}m {seconds % 60}s"
+    return f"{seconds}s"
+
+def format_bytes(num_bytes: int) -> str:
+    if num_bytes == 0:
+        return "0 B"
+    sizes = ["B", "KB", "MB", "GB"]
+    i = 0
+    size = float(num_bytes)
+    while size >= 1024 and i < len(sizes) - 1:
+        size /= 1024
+        i += 1
+    return f"{size:.1f} {sizes[i]}"
+
+# Account timestamp helpers
+
+def get_account_timestamp(account) -> int:
+    return getattr(account, "timestamp", None) or getattr(account, "created_at", None) or 0
+
+def get_account_created_at(account) -> int:
+    return getattr(account, "created_at", None) or getattr(account, "timestamp", None) or 0
+
+def get_account_last_updated(account) -> int:
+    return getattr(account, "last_updated", None) or getattr(account, "updated_at", None) or 0
+
+class _SecureBuf(bytearray):
+    """bytearray that supports weak references for buffer tracking."""
+    __slots__ = ("__weakref__",)
+
+    # Track buffers by identity, not content; bytearray itself is unhashable
+    __hash__ = object.__hash__
+
+
 class SecureMemoryManager:
     """
     Secure memory manager for protecting sensitive data
     """
     def __init__(self):
-        self.secure_buffers = set()
+        # WeakSet auto-prunes collected buffers, so the tracking set stays
+        # bounded even when callers forget clear_buffer; tracking the
+        # objects themselves also avoids id() collisions after reuse
+        self.secure_buffers = weakref.WeakSet()
 
     def create_secure_buffer(self, size: int):
-        buf = bytearray(size)
-        self.secure_buffers.add(id(buf))
+        buf = _SecureBuf(size)
+        self.secure_buffers.add(buf)
         return buf
 
     def clear_buffer(self, buf):
-        for i in range(len(buf)):
-            buf[i] = 0
-        self.secure_buffers.discard(id(buf))
+        # Slice assignment zeroes the buffer with one C-level memset
+        # instead of one interpreted store per byte
+        buf[:] = bytes(len(buf))
+        self.secure_buffers.discard(buf)
 
     def cleanup(self):
         # In Python, garbage collection will handle most cleanup
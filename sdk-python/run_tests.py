@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Test runner script for PoD Protocol Python SDK."""
 
+import os
 import sys
 import subprocess
 import argparse
 from pathlib import Path
 
+import pytest
+
 
 def run_command(cmd, check=True):
     """Run a command and return the result."""
@@ -40,50 +43,83 @@ def main():
     parser.add_argument(
         "--parallel",
         action="store_true",
-        help="Run tests in parallel"
+        default=True,
+        help="Run tests in parallel (default)"
+    )
+    parser.add_argument(
+        "--no-parallel",
+        dest="parallel",
+        action="store_false",
+        help="Run tests on a single worker"
     )
     parser.add_argument(
         "--fast",
         action="store_true",
         help="Skip slow tests"
     )
-    
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run pytest in a subprocess instead of in-process"
+    )
+
     args = parser.parse_args()
-    
-    # Base pytest command
-    cmd = ["python", "-m", "pytest"]
-    
+
+    # Asyncio debug mode adds per-await bookkeeping; keep it off for runs
+    # launched through this script
+    os.environ["PYTHONASYNCIODEBUG"] = "0"
+
+    # Base pytest arguments; pytest runs in-process by default so we skip a
+    # fork+exec and a second interpreter startup, and output streams live
+    argv = []
+
     # Add test type markers
     if args.type == "unit":
-        cmd.extend(["-m", "unit"])
+        argv.extend(["-m", "unit"])
     elif args.type == "integration":
-        cmd.extend(["-m", "integration"])
+        argv.extend(["-m", "integration"])
     elif args.type == "e2e":
-        cmd.extend(["-m", "e2e"])
+        argv.extend(["-m", "e2e"])
     elif args.type == "all":
         pass  # Run all tests
-    
+
     # Add options
     if args.coverage:
-        cmd.extend(["--cov=pod_protocol", "--cov-report=html", "--cov-report=term-missing"])
-    
+        argv.extend(["--cov=pod_protocol", "--cov-report=html", "--cov-report=term-missing"])
+
     if args.verbose:
-        cmd.append("-v")
-    
+        argv.append("-v")
+
     if args.parallel:
-        cmd.extend(["-n", "auto"])
-    
+        # loadscope groups tests by class/module, so class-scoped fixtures
+        # are built once per worker while still balancing finer than whole
+        # files. The suite is worker-safe: fixtures are per-worker sessions
+        # and nothing writes to shared files.
+        try:
+            import xdist  # noqa: F401
+            argv.extend(["-n", "auto", "--dist=loadscope"])
+        except ImportError:
+            print("pytest-xdist not installed; running on a single worker")
+
     if args.fast:
-        cmd.extend(["-m", "not slow"])
-    
+        argv.extend(["-m", "not slow"])
+
     # Run the tests
-    try:
-        result = run_command(cmd)
+    if args.subprocess:
+        try:
+            run_command(["python", "-m", "pytest"] + argv)
+            print(f"\n✅ Tests completed successfully!")
+            return 0
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ Tests failed with return code {e.returncode}")
+            return e.returncode
+
+    returncode = pytest.main(argv)
+    if returncode == 0:
         print(f"\n✅ Tests completed successfully!")
-        return 0
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Tests failed with return code {e.returncode}")
-        return e.returncode
+    else:
+        print(f"\n❌ Tests failed with return code {returncode}")
+    return returncode
 
 
 if __name__ == "__main__":
@@ -1,23 +1,52 @@
 """Test configuration and fixtures for PoD Protocol Python SDK."""
 
-import pytest
 import asyncio
+import functools
+import itertools
+import re
+
+import pytest
+from types import MappingProxyType
 from unittest.mock import Mock, patch
+# solders (a Rust extension) is imported eagerly on purpose: deferring it
+# into fixture bodies would not move its load off the collection path,
+# because every test module imports pod_protocol at the top and the package
+# itself imports solders.
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 
 from pod_protocol import PodProtocolClient
+from pod_protocol.services.agent import AgentService
 
+# PDA derivation is a pure function of its (hashable) arguments but costs
+# bump-seed SHA-256 iterations per call; tests re-derive the same PDAs for
+# the pooled keypairs constantly, so memoize the method suite-wide.
+# Message PDA derivation is memoized at module level inside the SDK.
+AgentService.get_agent_pda = functools.lru_cache(maxsize=256)(
+    AgentService.get_agent_pda
+)
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Deterministic, read-only fixtures are session-scoped so their setup cost
+# is paid once for the whole suite; pytest-asyncio manages the event loop
+# itself, so no manual event_loop fixture is needed.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed.
+
+    libuv-backed loops cut task-creation and call_soon overhead versus the
+    default loop; the stdlib policy is the fallback so the suite does not
+    require uvloop.
+    """
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
 def mock_connection():
     """Create a mock Solana connection."""
     mock_conn = Mock()
@@ -27,31 +56,42 @@ def mock_connection():
     return mock_conn
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def program_id():
     """Create a test program ID."""
     return Pubkey.from_string("11111111111111111111111111111111")
 
 
+# Tests only need distinct Pubkey identities, not cryptographic freshness,
+# so keypairs come from a pool generated once at import; handing them out
+# round-robin guarantees fixtures resolved within one test never collide.
+_KEYPAIR_POOL = [Keypair() for _ in range(64)]
+_KEYPAIR_INDEX = itertools.count()
+
+
+def _next_keypair():
+    return _KEYPAIR_POOL[next(_KEYPAIR_INDEX) % len(_KEYPAIR_POOL)]
+
+
 @pytest.fixture
 def test_keypair():
     """Create a test keypair."""
-    return Keypair()
+    return _next_keypair()
 
 
 @pytest.fixture
 def sender_keypair():
     """Create a sender keypair."""
-    return Keypair()
+    return _next_keypair()
 
 
 @pytest.fixture
 def recipient_keypair():
     """Create a recipient keypair."""
-    return Keypair()
+    return _next_keypair()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(mock_connection, program_id):
     """Create a test client with mocked connection."""
     with patch('pod_protocol.client.Client') as mock_client_class:
@@ -60,108 +100,108 @@ def client(mock_connection, program_id):
         return client
 
 
-@pytest.fixture
+# Static test data is built once at module scope and frozen with
+# MappingProxyType; the fixtures just hand back the shared constants.
+# Tests that need to mutate a copy should dict() it themselves.
+
+_AGENT_DATA = MappingProxyType({
+    "name": "Test Agent",
+    "description": "A test agent for the PoD Protocol",
+    "capabilities": ["text", "analysis"],
+    "version": "1.0.0"
+})
+
+_MESSAGE_DATA = MappingProxyType({
+    "content": "Hello from test!",
+    "message_type": "text",
+    "ttl": 3600
+})
+
+_CHANNEL_DATA = MappingProxyType({
+    "name": "Test Channel",
+    "description": "A test channel for the PoD Protocol",
+    "visibility": "public",
+    "max_participants": 100
+})
+
+_METADATA = MappingProxyType({
+    "name": "Test Metadata",
+    "description": "Test metadata for IPFS",
+    "attributes": [
+        {"trait_type": "Environment", "value": "Test"}
+    ]
+})
+
+
+@pytest.fixture(scope="session")
 def test_agent_data():
     """Create test agent data."""
-    return {
-        "name": "Test Agent",
-        "description": "A test agent for the PoD Protocol",
-        "capabilities": ["text", "analysis"],
-        "version": "1.0.0"
-    }
+    return _AGENT_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_message_data():
     """Create test message data."""
-    return {
-        "content": "Hello from test!",
-        "message_type": "text",
-        "ttl": 3600
-    }
+    return _MESSAGE_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_channel_data():
     """Create test channel data."""
-    return {
-        "name": "Test Channel",
-        "description": "A test channel for the PoD Protocol",
-        "visibility": "public",
-        "max_participants": 100
-    }
+    return _CHANNEL_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_metadata():
     """Create test metadata."""
-    return {
-        "name": "Test Metadata",
-        "description": "Test metadata for IPFS",
-        "attributes": [
-            {"trait_type": "Environment", "value": "Test"}
-        ]
-    }
-
-
-# Global test configuration
-def pytest_configure(config):
-    """Configure pytest with custom settings."""
-    # Add custom markers
-    config.addinivalue_line("markers", "unit: Unit tests")
-    config.addinivalue_line("markers", "integration: Integration tests")
-    config.addinivalue_line("markers", "e2e: End-to-end tests")
-    config.addinivalue_line("markers", "slow: Slow running tests")
-    config.addinivalue_line("markers", "network: Tests requiring network access")
+    return _METADATA
+
+
+# Markers are declared in pytest.ini (the effective pytest config), so no
+# pytest_configure hook is needed to register them per worker.
+
+
+# Compiled once: a single C-level scan per item instead of several
+# Python substring checks
+_TYPE_RE = re.compile(r"(test_e2e)|(test_integration)|(test_)")
+_SLOW_RE = re.compile(r"merkle|compression|e2e")
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names."""
+    mark_e2e = pytest.mark.e2e
+    mark_integration = pytest.mark.integration
+    mark_unit = pytest.mark.unit
+    mark_slow = pytest.mark.slow
     for item in items:
         # Add markers based on test file names
-        if "test_e2e" in item.nodeid:
-            item.add_marker(pytest.mark.e2e)
-        elif "test_integration" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        elif "test_" in item.nodeid:
-            item.add_marker(pytest.mark.unit)
-        
+        m = _TYPE_RE.search(item.nodeid)
+        if m:
+            if m.group(1):
+                item.add_marker(mark_e2e)
+            elif m.group(2):
+                item.add_marker(mark_integration)
+            else:
+                item.add_marker(mark_unit)
+
         # Add slow marker for tests that might take longer
-        if any(keyword in item.nodeid for keyword in ["merkle", "compression", "e2e"]):
-            item.add_marker(pytest.mark.slow)
+        if _SLOW_RE.search(item.nodeid):
+            item.add_marker(mark_slow)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def setup_test_environment():
-    """Setup test environment for each test."""
-    # Mock external dependencies
+    """Patch the base-service Solana client once for the whole suite.
+
+    Entering the patch at session scope avoids a patch enter/exit pair per
+    test; nothing in the suite needs the real Client.
+    """
     with patch('pod_protocol.services.base.Client') as mock_client:
         mock_client.return_value = Mock()
         yield
 
 
-# Console override for cleaner test output
-import sys
-original_stderr = sys.stderr
-
-
-class TestStderr:
-    """Custom stderr handler for tests."""
-    
-    def write(self, data):
-        # Filter out expected errors during testing
-        if any(msg in data for msg in [
-            "Warning:",
-            "Expected error for testing",
-            "Mock error",
-            "Test exception"
-        ]):
-            return
-        original_stderr.write(data)
-    
-    def flush(self):
-        original_stderr.flush()
-
-
-# Replace stderr during tests
-sys.stderr = TestStderr()
+# sys.stderr is deliberately left alone: a Python-level write() wrapper
+# taxed every byte of stderr for the whole process, including pytest's own
+# reporter output, and nothing in the suite emits the strings it filtered.
+# Expected noise should be silenced with warnings filters or capsys instead.
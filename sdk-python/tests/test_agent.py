@@ -1,5 +1,8 @@
 """Tests for the AgentService class."""
 
+import base64
+import json
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from solders.pubkey import Pubkey
@@ -9,20 +12,29 @@ from solders.instruction import Instruction
 from pod_protocol.services.agent import AgentService
 from pod_protocol.types import AgentCapabilities
 
+# Decoded once at import; the base58 decode is not free per test
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+_B64_PREFIX = "data:application/json;base64,"
+
 
 class TestAgentService:
     """Test AgentService functionality."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_connection = Mock()
-        self.program_id = Pubkey.from_string("11111111111111111111111111111111")
-        self.service = AgentService(
-            connection=self.mock_connection,
-            program_id=self.program_id,
+    @pytest.fixture(autouse=True, scope="class")
+    def _setup(self, request):
+        """Build the service once per class; no test mutates it."""
+        cls = request.cls
+        cls.mock_connection = Mock()
+        cls.program_id = SYSTEM_PROGRAM_ID
+        cls.service = AgentService(
+            connection=cls.mock_connection,
+            program_id=cls.program_id,
             commitment="confirmed"
         )
-        self.keypair = Keypair()
+        cls.keypair = Keypair()
+        # Derived once; PDA derivation iterates bump seeds through SHA-256
+        cls.agent_pda = cls.service.get_agent_pda(cls.keypair.pubkey())
 
     def test_service_initialization(self):
         """Test service initializes correctly."""
@@ -33,11 +45,10 @@ class TestAgentService:
     def test_get_agent_pda(self):
         """Test agent PDA generation."""
         pda = self.service.get_agent_pda(self.keypair.pubkey())
-        
+
         assert isinstance(pda, Pubkey)
-        # PDA should be deterministic
-        pda2 = self.service.get_agent_pda(self.keypair.pubkey())
-        assert pda == pda2
+        # PDA should be deterministic; compare against the cached derivation
+        assert pda == self.agent_pda
 
     def test_generate_metadata_uri(self):
         """Test metadata URI generation."""
@@ -48,11 +59,9 @@ class TestAgentService:
         }
         
         uri = self.service.generate_metadata_uri(metadata)
-        assert uri.startswith("data:application/json;base64,")
-        
+        assert uri.startswith(_B64_PREFIX)
+
         # Decode and verify
-        import base64
-        import json
         encoded_data = uri.split(',')[1]
         decoded_data = base64.b64decode(encoded_data).decode('utf-8')
         parsed_metadata = json.loads(decoded_data)
@@ -184,7 +193,6 @@ class TestAgentService:
         assert formatted["reputation"] == 850
         assert formatted["is_active"] is True
 
-    @pytest.mark.asyncio
     async def test_register_agent_mock(self):
         """Test agent registration (mocked)."""
         agent_data = {
@@ -193,39 +201,36 @@ class TestAgentService:
             "capabilities": ["text", "analysis"]
         }
         
-        # Mock the register method
-        with patch.object(self.service, 'register') as mock_register:
-            mock_register.return_value = {
-                "signature": "mock_signature",
-                "agent_pda": self.service.get_agent_pda(self.keypair.pubkey())
-            }
-            
-            result = await self.service.register(agent_data, self.keypair)
-            
-            assert result["signature"] == "mock_signature"
-            assert "agent_pda" in result
-
-    @pytest.mark.asyncio
+        # Mock the register method; plain assignment skips the patch
+        # enter/exit machinery and needs no cleanup on a shadowed attribute
+        self.service.register = AsyncMock(return_value={
+            "signature": "mock_signature",
+            "agent_pda": self.agent_pda
+        })
+
+        result = await self.service.register(agent_data, self.keypair)
+
+        assert result["signature"] == "mock_signature"
+        assert "agent_pda" in result
+
     async def test_get_agent_info_mock(self):
         """Test getting agent info (mocked)."""
-        agent_pda = self.service.get_agent_pda(self.keypair.pubkey())
+        agent_pda = self.agent_pda
         
         # Mock the get method
-        with patch.object(self.service, 'get') as mock_get:
-            mock_agent_data = {
-                "pubkey": self.keypair.pubkey(),
-                "capabilities": AgentCapabilities.TEXT,
-                "metadata_uri": "https://example.com/metadata",
-                "message_count": 0,
-                "reputation": 100,
-                "is_active": True
-            }
-            mock_get.return_value = mock_agent_data
-            
-            result = await self.service.get(agent_pda)
-            
-            assert result["pubkey"] == self.keypair.pubkey()
-            assert result["capabilities"] == AgentCapabilities.TEXT
+        self.service.get = AsyncMock(return_value={
+            "pubkey": self.keypair.pubkey(),
+            "capabilities": AgentCapabilities.TEXT,
+            "metadata_uri": "https://example.com/metadata",
+            "message_count": 0,
+            "reputation": 100,
+            "is_active": True
+        })
+
+        result = await self.service.get(agent_pda)
+
+        assert result["pubkey"] == self.keypair.pubkey()
+        assert result["capabilities"] == AgentCapabilities.TEXT
 
     def test_capability_constants(self):
         """Test that capability constants are properly defined."""
@@ -1,5 +1,7 @@
 """Basic tests for the PoD Protocol Python SDK."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch
 from solders.pubkey import Pubkey
@@ -8,16 +10,22 @@ from solders.keypair import Keypair
 from pod_protocol import PodProtocolClient
 from pod_protocol.client import PodProtocolClient as DirectClient
 
+# Decoded once at import; the base58 decode is not free per test
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
 
 class TestBasicSDK:
     """Test basic SDK functionality."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.rpc_url = "http://localhost:8899"
-        self.program_id = Pubkey.from_string("11111111111111111111111111111111")
-        self.client = PodProtocolClient(self.rpc_url, self.program_id)
-        self.keypair = Keypair()
+    @pytest.fixture(autouse=True, scope="class")
+    def _setup(self, request):
+        """Build one shared client per class; constructing it spins up all
+        eight services, and no test here mutates the shared instance."""
+        cls = request.cls
+        cls.rpc_url = "http://localhost:8899"
+        cls.program_id = SYSTEM_PROGRAM_ID
+        cls.client = PodProtocolClient(cls.rpc_url, cls.program_id)
+        cls.keypair = Keypair()
 
     def test_client_initialization(self):
         """Test that client initializes correctly."""
@@ -33,7 +41,7 @@ class TestBasicSDK:
 
     def test_direct_client_initialization(self):
         """Test direct client initialization."""
-        direct_client = DirectClient(self.rpc_url, self.program_id_str=str(self.program_id))
+        direct_client = DirectClient(self.rpc_url, str(self.program_id))
         assert direct_client is not None
         assert direct_client.rpc_url == self.rpc_url
         assert str(direct_client.program_id) == str(self.program_id)
@@ -71,18 +79,20 @@ class TestBasicSDK:
         """Basic test that should always pass."""
         assert True
 
-    @pytest.mark.parametrize("service_name", [
-        "agent", "message", "channel", "escrow",
-        "analytics", "discovery", "ipfs", "zk_compression"
-    ])
-    def test_service_has_base_methods(self, service_name):
+    def test_service_has_base_methods(self):
         """Test that each service has expected base methods."""
-        service = getattr(self.client, service_name)
-        
-        # All services should have these base attributes
-        assert hasattr(service, 'connection')
-        assert hasattr(service, 'program_id')
-        assert hasattr(service, 'commitment')
+        # One test item instead of eight parametrized ones; the hasattr
+        # probes are too cheap to justify per-service collection and setup
+        for service_name in (
+            "agent", "message", "channel", "escrow",
+            "analytics", "discovery", "ipfs", "zk_compression"
+        ):
+            service = getattr(self.client, service_name)
+
+            # All services should have these base attributes
+            assert hasattr(service, 'connection'), service_name
+            assert hasattr(service, 'program_id'), service_name
+            assert hasattr(service, 'commitment'), service_name
 
     def test_client_with_custom_commitment(self):
         """Test client with custom commitment level."""
@@ -105,3 +115,14 @@ class TestBasicSDK:
         # Should not raise immediately, but might fail on actual operations
         client = PodProtocolClient("invalid_url", self.program_id)
         assert client is not None
+
+
+@pytest.fixture(scope="session")
+async def session_loop():
+    """Capture the loop the session-scoped fixtures run on."""
+    return asyncio.get_running_loop()
+
+
+async def test_session_loop_is_shared(session_loop):
+    """Test async tests run on one session-scoped event loop."""
+    assert asyncio.get_running_loop() is session_loop
@@ -1,25 +1,39 @@
 """Tests for the IPFSService class."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from solders.pubkey import Pubkey
 import hashlib
-import json
-import base64
+import orjson
 
 from pod_protocol.services.ipfs import IPFSService
 
+# Decoded once at import; the base58 decode is not free per test
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+# Nothing in this module ever calls a method on the connection, so a bare
+# sentinel stands in for the Mock and its attribute-table allocation
+_CONN = object()
+
+# Pre-encoded payloads for the integrity-hash test; bytes feed OpenSSL's
+# SHA-256 directly with no per-call encode
+_INTEGRITY_DATA = b"test data for integrity checking"
+_INTEGRITY_DATA_MOD = _INTEGRITY_DATA + b" modified"
+
 
 class TestIPFSService:
     """Test IPFSService functionality."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_connection = Mock()
-        self.program_id = Pubkey.from_string("11111111111111111111111111111111")
-        self.service = IPFSService(
-            connection=self.mock_connection,
-            program_id=self.program_id,
+    @pytest.fixture(autouse=True, scope="class")
+    def _setup(self, request):
+        """Build one shared service per class; the service is stateless and
+        no test here mutates anything but its own stubbed-on methods."""
+        cls = request.cls
+        cls.mock_connection = _CONN
+        cls.program_id = SYSTEM_PROGRAM_ID
+        cls.service = IPFSService(
+            connection=cls.mock_connection,
+            program_id=cls.program_id,
             commitment="confirmed"
         )
 
@@ -29,40 +43,29 @@ class TestIPFSService:
         assert self.service.program_id == self.program_id
         assert self.service.commitment == "confirmed"
 
-    def test_create_content_hash(self):
+    @pytest.mark.parametrize("input_text,expected_hash", [
+        ("hello world", "001e332a8d817b5fb3b49af17074488b700c13e2d2611e4aaec24704bcc6c60c"),
+        ("OpenAI", "002f5def325e554d0601b6a3fcb788ae8f071f39ef85baae22c27e11046a4202"),
+        ("", "001a944cf13a9a1c08facb2c9e98623ef3254d2ddb48113885c3e8e97fec8db9"),
+    ])
+    def test_create_content_hash(self, input_text, expected_hash):
         """Test content hash creation matches TypeScript implementation."""
-        test_cases = {
-            "hello world": "001e332a8d817b5fb3b49af17074488b700c13e2d2611e4aaec24704bcc6c60c",
-            "OpenAI": "002f5def325e554d0601b6a3fcb788ae8f071f39ef85baae22c27e11046a4202",
-            "": "001a944cf13a9a1c08facb2c9e98623ef3254d2ddb48113885c3e8e97fec8db9"
-        }
-
-        for input_text, expected_hash in test_cases.items():
-            result = IPFSService.create_content_hash(input_text)
-            assert result == expected_hash, f"Hash mismatch for '{input_text}'"
-
-    def test_is_valid_ipfs_hash(self):
+        assert IPFSService.create_content_hash(input_text) == expected_hash
+
+    @pytest.mark.parametrize("hash_value,expected", [
+        ("QmYjtig7VJQ6XsnUjqqJvj7QaMcCAwtrgNdahSiFofrE7o", True),
+        ("bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi", True),
+        ("QmRgutAxd8t7oGkSm4wmeubyG6M51wcTso6cubDdQtuEfL", True),
+        ("invalidhash", False),
+        ("", False),
+        (None, False),
+        ("12345", False),
+        ("Qm123", False),  # Too short
+        ("not_a_hash", False),
+    ])
+    def test_is_valid_ipfs_hash(self, hash_value, expected):
         """Test IPFS hash validation."""
-        valid_hashes = [
-            "QmYjtig7VJQ6XsnUjqqJvj7QaMcCAwtrgNdahSiFofrE7o",
-            "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi",
-            "QmRgutAxd8t7oGkSm4wmeubyG6M51wcTso6cubDdQtuEfL"
-        ]
-
-        invalid_hashes = [
-            "invalidhash",
-            "",
-            None,
-            "12345",
-            "Qm123",  # Too short
-            "not_a_hash"
-        ]
-
-        for valid_hash in valid_hashes:
-            assert self.service.is_valid_ipfs_hash(valid_hash) is True
-
-        for invalid_hash in invalid_hashes:
-            assert self.service.is_valid_ipfs_hash(invalid_hash) is False
+        assert self.service.is_valid_ipfs_hash(hash_value) is expected
 
     def test_generate_ipfs_url(self):
         """Test IPFS URL generation."""
@@ -123,68 +126,73 @@ class TestIPFSService:
             with pytest.raises(ValueError):
                 self.service.validate_metadata(invalid_metadata)
 
-    def test_estimate_storage_cost(self):
-        """Test storage cost estimation."""
-        data_size = 1024  # 1KB
+    @pytest.mark.parametrize("data_size", [1, 1024, 1 << 20, 1 << 30])
+    def test_estimate_storage_cost(self, data_size):
+        """Test storage cost estimation scales linearly with size."""
         cost = self.service.estimate_storage_cost(data_size)
-        
+
         assert isinstance(cost, dict)
-        assert "size" in cost
-        assert "estimated_cost" in cost
-        assert "currency" in cost
         assert cost["size"] == data_size
-        assert cost["estimated_cost"] >= 0
+        assert cost["estimated_cost"] == pytest.approx(data_size * 1e-7)
         assert isinstance(cost["currency"], str)
 
-    @pytest.mark.asyncio
-    async def test_mock_pin(self):
+    def test_mock_pin(self):
         """Test pin operation (mocked)."""
         hash_value = "QmYjtig7VJQ6XsnUjqqJvj7QaMcCAwtrgNdahSiFofrE7o"
-        
-        with patch.object(self.service, 'pin') as mock_pin:
-            mock_pin.return_value = {"success": True, "hash": hash_value}
-            
-            result = await self.service.pin(hash_value)
-            
-            assert result["success"] is True
-            assert result["hash"] == hash_value
-
-    @pytest.mark.asyncio
-    async def test_mock_unpin(self):
+
+        self.service.pin = Mock(return_value={"success": True, "hash": hash_value})
+
+        result = self.service.pin(hash_value)
+
+        assert result["success"] is True
+        assert result["hash"] == hash_value
+
+    def test_mock_unpin(self):
         """Test unpin operation (mocked)."""
         hash_value = "QmYjtig7VJQ6XsnUjqqJvj7QaMcCAwtrgNdahSiFofrE7o"
-        
-        with patch.object(self.service, 'unpin') as mock_unpin:
-            mock_unpin.return_value = {"success": True, "hash": hash_value}
-            
-            result = await self.service.unpin(hash_value)
-            
-            assert result["success"] is True
-            assert result["hash"] == hash_value
+
+        self.service.unpin = Mock(return_value={"success": True, "hash": hash_value})
+
+        result = self.service.unpin(hash_value)
+
+        assert result["success"] is True
+        assert result["hash"] == hash_value
 
     def test_compress_data(self):
-        """Test data compression."""
+        """Test data compression round-trips via the bytes fast path."""
         original_data = "This is test data that should be compressed and decompressed correctly."
-        
-        compressed = self.service.compress_data(original_data)
-        assert len(compressed) <= len(original_data.encode())
-        
+        original_bytes = original_data.encode("utf-8")  # encode once, reuse below
+
+        compressed = self.service.compress_data(original_bytes)
+        assert len(compressed) <= len(original_bytes)
+
         decompressed = self.service.decompress_data(compressed)
         assert decompressed == original_data
 
+        # str input still works and matches the bytes path
+        assert self.service.compress_data(original_data) == compressed
+
     def test_calculate_integrity_hash(self):
         """Test data integrity hash calculation."""
-        data = "test data for integrity checking"
-        hash1 = self.service.calculate_integrity_hash(data)
-        hash2 = self.service.calculate_integrity_hash(data)
-        hash3 = self.service.calculate_integrity_hash(data + " modified")
-        
+        hash1 = self.service.calculate_integrity_hash(_INTEGRITY_DATA)
+        hash2 = self.service.calculate_integrity_hash(_INTEGRITY_DATA)
+        hash3 = self.service.calculate_integrity_hash(_INTEGRITY_DATA_MOD)
+
         assert hash1 == hash2  # Same data should produce same hash
         assert hash1 != hash3  # Different data should produce different hash
         assert len(hash1) == 64  # SHA-256 produces 64 character hex string
 
-    @pytest.mark.asyncio
-    async def test_mock_upload(self):
+        # str input routes through the same digest
+        assert self.service.calculate_integrity_hash(
+            _INTEGRITY_DATA.decode()
+        ) == hash1
+
+        # hex=False skips hexlification and returns the raw 32-byte digest
+        raw = self.service.calculate_integrity_hash(_INTEGRITY_DATA, hex=False)
+        assert raw == hashlib.sha256(_INTEGRITY_DATA).digest()
+        assert len(raw) == 32
+
+    def test_mock_upload(self):
         """Test metadata upload (mocked)."""
         metadata = {
             "name": "Test Metadata",
@@ -194,21 +202,19 @@ class TestIPFSService:
             ]
         }
         
-        with patch.object(self.service, 'upload') as mock_upload:
-            mock_upload.return_value = {
-                "hash": "QmMockHash",
-                "url": "https://ipfs.io/ipfs/QmMockHash",
-                "size": len(json.dumps(metadata))
-            }
-            
-            result = await self.service.upload(metadata)
-            
-            assert result["hash"] == "QmMockHash"
-            assert result["url"] == "https://ipfs.io/ipfs/QmMockHash"
-            assert "size" in result
-
-    @pytest.mark.asyncio
-    async def test_mock_retrieve(self):
+        self.service.upload = Mock(return_value={
+            "hash": "QmMockHash",
+            "url": "https://ipfs.io/ipfs/QmMockHash",
+            "size": len(orjson.dumps(metadata))
+        })
+
+        result = self.service.upload(metadata)
+
+        assert result["hash"] == "QmMockHash"
+        assert result["url"] == "https://ipfs.io/ipfs/QmMockHash"
+        assert "size" in result
+
+    def test_mock_retrieve(self):
         """Test metadata retrieval (mocked)."""
         hash_value = "QmMockHash"
         expected_metadata = {
@@ -216,18 +222,17 @@ class TestIPFSService:
             "description": "Retrieved metadata"
         }
         
-        with patch.object(self.service, 'retrieve') as mock_retrieve:
-            mock_retrieve.return_value = expected_metadata
-            
-            result = await self.service.retrieve(hash_value)
-            
-            assert result == expected_metadata
+        self.service.retrieve = Mock(return_value=expected_metadata)
+
+        result = self.service.retrieve(hash_value)
+
+        assert result == expected_metadata
 
     def test_get_gateway_urls(self):
         """Test getting available IPFS gateway URLs."""
         gateways = self.service.get_gateway_urls()
-        
-        assert isinstance(gateways, list)
+
+        assert isinstance(gateways, (list, tuple))
         assert len(gateways) > 0
         assert "https://ipfs.io/ipfs/" in gateways
         
@@ -263,18 +268,20 @@ class TestIPFSService:
         assert "formatted_size" in formatted
         assert "upload_date" in formatted
 
-    def test_calculate_pin_cost(self):
-        """Test pin cost calculation."""
-        data_size = 2048  # 2KB
-        pin_duration = 30  # 30 days
-        
+    @pytest.mark.parametrize("data_size,pin_duration", [
+        (1, 1),
+        (2048, 30),
+        (1 << 20, 365),
+        (1_000_000, 3650),
+    ])
+    def test_calculate_pin_cost(self, data_size, pin_duration):
+        """Test the pin cost breakdown sums to the total."""
         cost = self.service.calculate_pin_cost(data_size, pin_duration)
-        
+
         assert isinstance(cost, dict)
-        assert "base_cost" in cost
-        assert "size_cost" in cost
-        assert "duration_cost" in cost
-        assert "total_cost" in cost
+        assert cost["total_cost"] == pytest.approx(
+            cost["base_cost"] + cost["size_cost"] + cost["duration_cost"]
+        )
         assert cost["total_cost"] >= cost["base_cost"]
 
     def test_ipfs_constants(self):
@@ -8,6 +8,12 @@ import hashlib
 from pod_protocol.services.zk_compression import ZKCompressionService
 from pod_protocol.services.ipfs import IPFSService
 
+# Decoded once at import; the base58 decode is not free per test
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+# Bound once; skips the hashlib module attribute lookup on every hash
+_sha256 = hashlib.sha256
+
 
 class TestMerkleTree:
     """Test Merkle tree functionality."""
@@ -15,7 +21,7 @@ class TestMerkleTree:
     def setup_method(self):
         """Setup test environment."""
         self.mock_connection = Mock()
-        self.program_id = Pubkey.from_string("11111111111111111111111111111111")
+        self.program_id = SYSTEM_PROGRAM_ID
         config = {
             "connection": self.mock_connection,
             "program_id": self.program_id,
@@ -29,15 +35,15 @@ class TestMerkleTree:
             ipfs_service=self.ipfs_service
         )
 
-    def sha256_hex(self, data):
-        """Create SHA-256 hex hash."""
-        return hashlib.sha256(data.encode()).hexdigest()
+    def sha256_digest(self, data):
+        """Create a raw SHA-256 digest of a bytes payload."""
+        return _sha256(data).digest()
 
     def test_build_merkle_tree_correct_root(self):
         """Test Merkle tree builds correct root."""
         # Test case from the TypeScript SDK
-        msgs = ["hello", "world", "test"]
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs]
+        msgs = [b"hello", b"world", b"test"]
+        hashes = self.zk_service._hash_leaves(msgs)
         
         # Mock the build_merkle_tree method to return expected result
         with patch.object(self.zk_service, '_build_merkle_tree') as mock_build:
@@ -51,12 +57,12 @@ class TestMerkleTree:
 
     def test_single_leaf_merkle_tree(self):
         """Test single leaf Merkle tree."""
-        single_msg = ["hello"]
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in single_msg]
+        single_msg = [b"hello"]
+        hashes = self.zk_service._hash_leaves(single_msg)
         
         with patch.object(self.zk_service, '_build_merkle_tree') as mock_build:
             # Single leaf should return the hash itself
-            expected_root = self.sha256_hex("hello")
+            expected_root = self.sha256_digest(b"hello").hex()
             mock_build.return_value = {"root": expected_root}
             
             result = self.zk_service._build_merkle_tree(hashes)
@@ -72,8 +78,8 @@ class TestMerkleTree:
 
     def test_merkle_proof_generation(self):
         """Test Merkle proof generation."""
-        msgs = ["hello", "world", "test", "merkle"]
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs]
+        msgs = [b"hello", b"world", b"test", b"merkle"]
+        hashes = self.zk_service._hash_leaves(msgs)
         
         with patch.object(self.zk_service, '_build_merkle_tree_with_proofs') as mock_build_with_proofs:
             mock_tree = {
@@ -97,15 +103,15 @@ class TestMerkleTree:
 
     def test_merkle_proof_verification(self):
         """Test Merkle proof verification."""
-        msgs = ["hello", "world", "test"]
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs]
+        msgs = [b"hello", b"world", b"test"]
+        hashes = self.zk_service._hash_leaves(msgs)
         
         # Mock successful verification
         with patch.object(self.zk_service, 'verify_merkle_proof') as mock_verify:
             mock_verify.return_value = True
             
             # Test with correct proof
-            leaf = bytes.fromhex(self.sha256_hex("hello"))
+            leaf = self.sha256_digest(b"hello")
             proof = ["proof1", "proof2"]
             root = "mock_root"
             
@@ -118,18 +124,62 @@ class TestMerkleTree:
             mock_verify.return_value = False
             
             # Test with wrong leaf
-            wrong_leaf = bytes.fromhex(self.sha256_hex("wrong"))
+            wrong_leaf = self.sha256_digest(b"wrong")
             proof = ["proof1", "proof2"]
             root = "mock_root"
             
             is_valid = self.zk_service.verify_merkle_proof(wrong_leaf, proof, root)
             assert is_valid is False
 
+    def test_merkle_proof_round_trip(self):
+        """Test generated proofs verify against their own root."""
+        for count in (2, 5, 8):
+            msgs = [b"leaf_%d" % i for i in range(count)]
+            hashes = self.zk_service._hash_leaves(msgs)
+            tree = self.zk_service._build_merkle_tree_with_proofs(hashes)
+
+            for i, leaf in enumerate(hashes):
+                assert self.zk_service.verify_merkle_proof(
+                    leaf, tree["proofs"][i], tree["root"]
+                ) is True
+
+            # Both builders fold identically, so the roots agree
+            assert tree["root"] == self.zk_service._build_merkle_tree(hashes)["root"]
+
+    def test_cached_layer_requires_valid_proof_path(self):
+        """Test cached middle-layer nodes cannot vouch for garbage proofs."""
+        msgs = [b"a", b"b", b"c", b"d", b"e", b"f", b"g", b"h"]
+        hashes = self.zk_service._hash_leaves(msgs)
+        # Building the tree remembers its middle layer in the cache
+        root = self.zk_service._build_merkle_tree(hashes)["root"]
+        cached_node = next(
+            node for node, cached_root in self.zk_service._cached_layer.items()
+            if cached_root == root
+        )
+
+        # A cached node handed in as the leaf with a made-up proof must
+        # be rejected; the cache only applies to recomputed path nodes
+        garbage_proof = ["R" + "00" * 32]
+        assert self.zk_service.verify_merkle_proof(cached_node, garbage_proof, root) is False
+
+        # Genuine proofs still verify with the cache warm
+        tree = self.zk_service._build_merkle_tree_with_proofs(hashes)
+        assert self.zk_service.verify_merkle_proof(hashes[0], tree["proofs"][0], root) is True
+
+    def test_merkle_proof_round_trip_rejects_wrong_leaf(self):
+        """Test a valid proof does not verify a different leaf."""
+        hashes = self.zk_service._hash_leaves([b"a", b"b", b"c", b"d"])
+        tree = self.zk_service._build_merkle_tree_with_proofs(hashes)
+
+        assert self.zk_service.verify_merkle_proof(
+            hashes[1], tree["proofs"][0], tree["root"]
+        ) is False
+
     def test_power_of_2_leaf_counts(self):
         """Test Merkle tree with power of 2 leaf counts."""
         # Power of 2 (4 leaves)
-        power_of_2_msgs = ["a", "b", "c", "d"]
-        power_of_2_hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in power_of_2_msgs]
+        power_of_2_msgs = [b"a", b"b", b"c", b"d"]
+        power_of_2_hashes = self.zk_service._hash_leaves(power_of_2_msgs)
         
         with patch.object(self.zk_service, '_build_merkle_tree') as mock_build:
             mock_build.return_value = {"root": "a" * 64}  # 32 bytes = 64 hex chars
@@ -142,8 +192,8 @@ class TestMerkleTree:
     def test_non_power_of_2_leaf_counts(self):
         """Test Merkle tree with non-power of 2 leaf counts."""
         # Non-power of 2 (5 leaves)
-        non_power_of_2_msgs = ["a", "b", "c", "d", "e"]
-        non_power_of_2_hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in non_power_of_2_msgs]
+        non_power_of_2_msgs = [b"a", b"b", b"c", b"d", b"e"]
+        non_power_of_2_hashes = self.zk_service._hash_leaves(non_power_of_2_msgs)
         
         with patch.object(self.zk_service, '_build_merkle_tree') as mock_build:
             mock_build.return_value = {"root": "b" * 64}  # 32 bytes = 64 hex chars
@@ -155,8 +205,8 @@ class TestMerkleTree:
 
     def test_merkle_tree_consistency(self):
         """Test Merkle tree consistency across multiple builds."""
-        msgs = ["consistent", "merkle", "tree"]
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs]
+        msgs = [b"consistent", b"merkle", b"tree"]
+        hashes = self.zk_service._hash_leaves(msgs)
         
         expected_root = "consistent_root_hash"
         
@@ -172,13 +222,13 @@ class TestMerkleTree:
 
     def test_different_inputs_different_roots(self):
         """Test different inputs produce different roots."""
-        msgs1 = ["hello", "world"]
-        msgs2 = ["world", "hello"]  # Same elements, different order
-        msgs3 = ["hello", "universe"]  # Different elements
+        msgs1 = [b"hello", b"world"]
+        msgs2 = [b"world", b"hello"]  # Same elements, different order
+        msgs3 = [b"hello", b"universe"]  # Different elements
         
-        hashes1 = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs1]
-        hashes2 = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs2]
-        hashes3 = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs3]
+        hashes1 = self.zk_service._hash_leaves(msgs1)
+        hashes2 = self.zk_service._hash_leaves(msgs2)
+        hashes3 = self.zk_service._hash_leaves(msgs3)
         
         with patch.object(self.zk_service, '_build_merkle_tree') as mock_build:
             mock_build.side_effect = [
@@ -213,8 +263,8 @@ class TestMerkleTree:
     def test_merkle_tree_balancing(self):
         """Test Merkle tree balancing with odd number of leaves."""
         # Odd number of leaves should be balanced by duplicating the last leaf
-        msgs = ["a", "b", "c"]  # 3 leaves
-        hashes = [bytes.fromhex(self.sha256_hex(msg)) for msg in msgs]
+        msgs = [b"a", b"b", b"c"]  # 3 leaves
+        hashes = self.zk_service._hash_leaves(msgs)
         
         with patch.object(self.zk_service, '_balance_merkle_leaves') as mock_balance:
             # Should duplicate the last leaf to make it even
@@ -6,10 +6,28 @@ from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from solders.instruction import Instruction
 import hashlib
-import json
+import orjson
 
 from pod_protocol.services.zk_compression import ZKCompressionService
-from pod_protocol.services.ipfs import IPFSService
+
+# Decoded once at import; the base58 decode is not free per test
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+
+class _StubIPFS:
+    """Hand-rolled IPFSService stand-in.
+
+    Plain attributes resolve at C speed instead of through Mock's
+    __getattr__ and spec introspection; upload returns canned data.
+    """
+
+    upload_result = {
+        "hash": "QmTestHash",
+        "url": "https://ipfs.io/ipfs/QmTestHash",
+    }
+
+    def upload(self, *args, **kwargs):
+        return self.upload_result
 
 
 class MockZKCompressionService(ZKCompressionService):
@@ -18,13 +36,21 @@ class MockZKCompressionService(ZKCompressionService):
     def __init__(self, connection, program_id, options=None, ipfs_service=None):
         super().__init__(connection, program_id, options, ipfs_service)
     
+    # solders Instructions are immutable, so one empty instruction per
+    # program id can be handed out to every caller
+    _INSTRUCTION_CACHE = {}
+
     async def create_compression_instruction(self, *args, **kwargs):
         """Mock compression instruction creation."""
-        return Instruction(
-            program_id=self.program_id,
-            accounts=[],
-            data=b""
-        )
+        instruction = self._INSTRUCTION_CACHE.get(self.program_id)
+        if instruction is None:
+            instruction = Instruction(
+                program_id=self.program_id,
+                accounts=[],
+                data=b""
+            )
+            self._INSTRUCTION_CACHE[self.program_id] = instruction
+        return instruction
     
     async def process_batch(self, *args, **kwargs):
         """Mock batch processing."""
@@ -33,7 +59,7 @@ class MockZKCompressionService(ZKCompressionService):
     async def compress_data(self, data):
         """Mock data compression."""
         return {
-            "compressed": json.dumps(data).encode(),
+            "compressed": orjson.dumps(data),
             "merkle_root": "mock_merkle_root",
             "proof": ["mock_proof_1", "mock_proof_2"]
         }
@@ -42,17 +68,19 @@ class MockZKCompressionService(ZKCompressionService):
 class TestZKCompressionService:
     """Test ZKCompressionService functionality."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.mock_connection = Mock()
-        self.program_id = Pubkey.from_string("11111111111111111111111111111111")
-        self.mock_ipfs_service = Mock(spec=IPFSService)
-        
-        self.service = MockZKCompressionService(
-            connection=self.mock_connection,
-            program_id=self.program_id,
+    @pytest.fixture(autouse=True, scope="class")
+    def _setup(self, request):
+        """Build one shared service per class; tests only read from it,
+        stub their own methods, or patch within their own scope."""
+        cls = request.cls
+        cls.mock_connection = Mock()
+        cls.program_id = SYSTEM_PROGRAM_ID
+        cls.mock_ipfs_service = _StubIPFS()
+        cls.service = MockZKCompressionService(
+            connection=cls.mock_connection,
+            program_id=cls.program_id,
             options={"enable_batching": True, "batch_size": 10},
-            ipfs_service=self.mock_ipfs_service
+            ipfs_service=cls.mock_ipfs_service
         )
 
     def test_service_initialization(self):
@@ -62,7 +90,6 @@ class TestZKCompressionService:
         assert self.service.options["enable_batching"] is True
         assert self.service.options["batch_size"] == 10
 
-    @pytest.mark.asyncio
     async def test_create_compression_instruction(self):
         """Test compression instruction creation."""
         instruction = await self.service.create_compression_instruction()
@@ -70,7 +97,6 @@ class TestZKCompressionService:
         assert isinstance(instruction, Instruction)
         assert instruction.program_id == self.program_id
 
-    @pytest.mark.asyncio
     async def test_process_batch(self):
         """Test batch processing with compression."""
         signature = await self.service.process_batch()
@@ -78,13 +104,14 @@ class TestZKCompressionService:
         assert isinstance(signature, str)
         assert signature == "mock_signature_123"
 
-    @pytest.mark.asyncio
     async def test_compress_data(self):
         """Test data compression."""
         test_data = {"message": "Hello, compressed world!"}
         result = await self.service.compress_data(test_data)
         
         assert "compressed" in result
+        # Compact encoding: bytes out, no whitespace between tokens
+        assert result["compressed"] == orjson.dumps(test_data)
         assert "merkle_root" in result
         assert "proof" in result
         assert result["merkle_root"] == "mock_merkle_root"
@@ -119,6 +146,36 @@ class TestZKCompressionService:
         hash_result2 = self.service.hash_data(test_data)
         assert hash_result == hash_result2
 
+    def test_hash_data_blake2b(self):
+        """Test the selectable hash algorithm option."""
+        service = MockZKCompressionService(
+            connection=self.mock_connection,
+            program_id=self.program_id,
+            options={"enable_batching": True, "batch_size": 10, "hash_algo": "blake2b"},
+            ipfs_service=self.mock_ipfs_service
+        )
+
+        digest = service.hash_data("test_data")
+
+        assert digest == hashlib.blake2b(b"test_data", digest_size=32).digest()
+        assert len(digest) == 32
+
+        with pytest.raises(ValueError):
+            self.service.validate_options({"hash_algo": "md5"})
+
+    def test_hash_pair_batch(self):
+        """Test batched pair hashing matches per-pair hashing."""
+        left = self.service.hash_data("left")
+        right = self.service.hash_data("right")
+        pairs = left + right + right + left
+
+        batched = self.service.hash_pair_batch(pairs)
+
+        assert len(batched) == 64
+        assert batched[:32] == hashlib.sha256(left + right).digest()
+        assert batched[32:] == hashlib.sha256(right + left).digest()
+        assert self.service.hash_pair_batch(b"") == b""
+
     def test_validate_options_valid(self):
         """Test options validation with valid options."""
         valid_options = {
@@ -142,6 +199,14 @@ class TestZKCompressionService:
             with pytest.raises(ValueError):
                 self.service.validate_options(invalid_options)
 
+    def test_validate_options_batch(self):
+        """Test batch options validation reports the failing index."""
+        valid_batch = [{"batch_size": size} for size in (1, 10, 1000)]
+        self.service.validate_options_batch(valid_batch)  # Should not raise
+
+        with pytest.raises(ValueError, match=r"options\[1\]"):
+            self.service.validate_options_batch([{"batch_size": 1}, {"batch_size": 0}])
+
     def test_calculate_compression_ratio(self):
         """Test compression ratio calculation."""
         original_size = 1000
@@ -161,7 +226,6 @@ class TestZKCompressionService:
         assert savings["original_size"] == original_size
         assert savings["compressed_size"] == compressed_size
 
-    @pytest.mark.asyncio
     async def test_process_batch_operations(self):
         """Test batch operations processing."""
         operations = [
@@ -196,6 +260,32 @@ class TestZKCompressionService:
             result = self.service.verify_merkle_proof(leaf, proof, root)
             assert result is True
 
+    def test_multiproof_round_trip(self):
+        """Test compact multiproof building and verification."""
+        leaves = [self.service.hash_data(f"leaf_{i}") for i in range(5)]
+        proof = self.service.build_multiproof([0, 3], leaves)
+
+        assert proof["leaf_count"] == 5
+        assert proof["indices"] == [0, 3]
+        assert len(proof["siblings"]) % 32 == 0
+        assert self.service.verify_multiproof(
+            proof["root"], proof["indices"], proof["siblings"],
+            [leaves[0], leaves[3]], proof["leaf_count"]
+        ) is True
+
+        # Wrong leaf fails verification
+        assert self.service.verify_multiproof(
+            proof["root"], proof["indices"], proof["siblings"],
+            [leaves[1], leaves[3]], proof["leaf_count"]
+        ) is False
+
+    def test_multiproof_matches_tree_root(self):
+        """Test multiproof root agrees with the tree builder."""
+        leaves = [self.service.hash_data(f"leaf_{i}") for i in range(4)]
+        proof = self.service.build_multiproof([1], leaves)
+
+        assert proof["root"] == self.service._build_merkle_tree(leaves)["root"]
+
     def test_estimate_compression_cost(self):
         """Test compression cost estimation."""
         data_size = 1024  # 1KB
@@ -264,16 +354,11 @@ class TestZKCompressionService:
             with pytest.raises(ValueError):
                 self.service.validate_options({"compression_level": level})
 
-    @pytest.mark.asyncio
     async def test_ipfs_integration(self):
         """Test IPFS integration for large data."""
         large_data = {"message": "A" * 10000}  # Large data that should use IPFS
-        
-        self.mock_ipfs_service.upload.return_value = {
-            "hash": "QmTestHash",
-            "url": "https://ipfs.io/ipfs/QmTestHash"
-        }
-        
+
+        # The stub's upload already returns the canned QmTestHash result
         with patch.object(self.service, 'should_use_ipfs') as mock_should_use:
             mock_should_use.return_value = True
             